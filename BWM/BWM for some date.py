@@ -1,91 +1,19 @@
 
-import numpy as np
-from scipy.optimize import linprog
-
-
-def solve_bwm(best_to_criteria, criteria_to_worst, n_criteria):
-    """
-    حل BWM برای یک خبره.
-    :param best_to_criteria: لیست مقایسه‌های بهترین-به-معیارها
-    :param criteria_to_worst: لیست مقایسه‌های معیارها-به-بدترین
-    :param n_criteria: تعداد معیارها
-    :return: وزن نهایی معیارها
-    """
-    # تعریف متغیرهای تصمیم
-    c = np.zeros(n_criteria + 1)
-    c[-1] = 1  # متغیر ایپسیلون (ε)
-
-    # محدودیت‌ها
-    A = []
-    b = []
-
-    # محدودیت‌های بهترین به معیارها
-    for i in range(n_criteria):
-        constraint = np.zeros(n_criteria + 1)
-        constraint[i] = -best_to_criteria[i]
-        constraint[-1] = -1
-        A.append(constraint)
-        b.append(0)
-
-        constraint = np.zeros(n_criteria + 1)
-        constraint[i] = best_to_criteria[i]
-        constraint[-1] = -1
-        A.append(constraint)
-        b.append(0)
-
-    # محدودیت‌های معیارها به بدترین
-    for i in range(n_criteria):
-        constraint = np.zeros(n_criteria + 1)
-        constraint[i] = -1 / criteria_to_worst[i]
-        constraint[-1] = -1
-        A.append(constraint)
-        b.append(0)
-
-        constraint = np.zeros(n_criteria + 1)
-        constraint[i] = 1 / criteria_to_worst[i]
-        constraint[-1] = -1
-        A.append(constraint)
-        b.append(0)
-
-    # محدودیت‌های نرمال‌سازی (جمع وزن‌ها = 1)
-    A_eq = [np.ones(n_criteria + 1)]
-    A_eq[0][-1] = 0
-    b_eq = [1]
-
-    # حل مسئله بهینه‌سازی خطی
-    result = linprog(c, A_ub=np.array(A), b_ub=np.array(b), A_eq=np.array(A_eq), b_eq=np.array(b_eq), bounds=(0, 1))
-
-    if result.success:
-        return result.x[:-1]  # وزن‌های نهایی
-    else:
-        raise ValueError("بهینه‌سازی خطی موفقیت‌آمیز نبود!")
-
-
-def aggregate_weights(weights_list):
-    """
-    تجمیع وزن‌ها با میانگین هندسی.
-    :param weights_list: لیست وزن‌های خبرگان
-    :return: وزن‌های تجمیع‌شده
-    """
-    weights_array = np.array(weights_list)
-    aggregated_weights = np.prod(weights_array, axis=0) ** (1 / len(weights_list))
-    return aggregated_weights
+import os
+import sys
 
+import numpy as np
 
-def rank_criteria(weights):
-    """
-    رتبه‌بندی معیارها بر اساس وزن نهایی.
-    :param weights: لیست وزن‌های نهایی معیارها
-    :return: لیست رتبه‌بندی معیارها
-    """
-    ranked_indices = np.argsort(weights)[::-1]  # مرتب‌سازی به ترتیب نزولی
-    ranked_weights = weights[ranked_indices]
-    return ranked_indices, ranked_weights
+# دسترسی به بسته dematel_lib در پوشه والد
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from dematel_lib.bwm import solve_bwm_batch, aggregate_weights, rank_criteria
+from dematel_lib.bwm_perturbation import perturbation_analysis
 
 # تعداد معیارها و خبرگان
 n_criteria = 22
 n_experts = 5  # تعداد خبرگان (می‌توانید این مقدار را تغییر دهید)
+n_perturbations = 2000  # تعداد بردار جابه‌جاشده (±1) برای هر خبره در تحلیل پایداری (0: غیرفعال)
 
 # داده‌های خبرگان
 best_to_criteria_list = [
@@ -104,22 +32,50 @@ criteria_to_worst_list = [
  [7, 8, 8, 7, 9, 6, 5, 4, 7, 2, 7, 6, 7, 4, 4, 6, 7, 8, 6, 1, 5, 8]
 ]
 
-# محاسبه وزن‌ها برای هر خبره
-weights_list = []
-for i in range(n_experts):
-    weights = solve_bwm(best_to_criteria_list[i], criteria_to_worst_list[i], n_criteria)
-    weights_list.append(weights)
 
-# تجمیع وزن‌های نهایی
-final_weights = aggregate_weights(weights_list)
+def print_perturbation_report(top_pairs=10):
+    """
+    پایداری رتبه‌بندی وقتی هر قضاوت ±1 روی مقیاس 1 تا 9 جابه‌جا شود
+    """
+    analysis = perturbation_analysis(best_to_criteria_list[:n_experts], criteria_to_worst_list[:n_experts],
+                                     n_samples=n_perturbations)
+    print(f"\nتحلیل پایداری ({n_perturbations} نمونه برای هر خبره، حل‌کننده: {analysis['solver']}):")
+    for rank, index in enumerate(analysis['ranking'], start=1):
+        distribution = analysis['rank_distribution'][index]
+        print(f"معیار {index + 1}: رتبه پایه {rank} | میانگین رتبه {analysis['mean_rank'][index]:.2f} "
+              f"± {analysis['rank_std'][index]:.2f} | احتمال حفظ رتبه {distribution[rank - 1]:.1%}")
+
+    print("\nبیشترین جابه‌جایی جفت معیارها:")
+    swaps = np.triu(analysis['swap_frequency'], 1)
+    for flat in np.argsort(swaps, axis=None)[::-1][:top_pairs]:
+        i, j = np.unravel_index(flat, swaps.shape)
+        print(f"معیار {i + 1} ↔ معیار {j + 1}: {swaps[i, j]:.1%}")
+
+
+def main():
+    # محاسبه وزن‌ها و مقدار سازگاری (ε*) همه خبرگان در یک فراخوانی
+    weights_list, xi = solve_bwm_batch(best_to_criteria_list[:n_experts],
+                                       criteria_to_worst_list[:n_experts])
+
+    # تجمیع وزن‌های نهایی
+    final_weights = aggregate_weights(weights_list)
+
+    # رتبه‌بندی معیارها
+    ranked_indices, ranked_weights = rank_criteria(final_weights)
+
+    # نمایش وزن‌های نهایی و رتبه‌بندی
+    print("وزن‌های تجمیع‌شده نهایی:")
+    print(final_weights)
+
+    print("\nمقدار سازگاری (ε*) هر خبره:", np.round(xi, 4))
+
+    print("\nرتبه‌بندی معیارها:")
+    for rank, (index, weight) in enumerate(zip(ranked_indices, ranked_weights), start=1):
+        print(f"رتبه {rank}: معیار {index + 1} با وزن {weight:.4f}")
 
-# رتبه‌بندی معیارها
-ranked_indices, ranked_weights = rank_criteria(final_weights)
+    if n_perturbations:
+        print_perturbation_report()
 
-# نمایش وزن‌های نهایی و رتبه‌بندی
-print("وزن‌های تجمیع‌شده نهایی:")
-print(final_weights)
 
-print("\nرتبه‌بندی معیارها:")
-for rank, (index, weight) in enumerate(zip(ranked_indices, ranked_weights), start=1):
-    print(f"رتبه {rank}: معیار {index + 1} با وزن {weight:.4f}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+DEMATEL / BWM toolkit
+هسته عددی فقط به NumPy وابسته است؛ ماژول‌های رسم، اکسل، scipy و pandas
+فقط هنگام اولین استفاده از نام مربوط بارگذاری می‌شوند.
+"""
+
+import importlib
+
+from .core import (
+    normalize_matrix,
+    calculate_total_relation_matrix,
+    influence_degrees,
+    combine_expert_opinions,
+)
+
+# نام عمومی ← زیرماژول (بارگذاری تنبل)
+_LAZY_ATTRIBUTES = {
+    'normalize_matrices': 'batch',
+    'batch_total_relation': 'batch',
+    'normalize_sparse_matrix': 'sparse',
+    'sparse_total_relation': 'sparse',
+    'krylov_solve': 'sparse',
+    'compute_influence_degrees': 'degrees',
+    'IncrementalTotalRelation': 'incremental',
+    'defuzzify': 'fuzzy',
+    'aggregate_fuzzy_opinions': 'fuzzy',
+    'normalize_fuzzy_matrix': 'fuzzy',
+    'fuzzy_dematel': 'fuzzy',
+    'categorize_net_effect': 'fuzzy',
+    'to_ranking_frame': 'fuzzy',
+    'bootstrap_degrees': 'bootstrap',
+    'sensitivity': 'sensitivity',
+    'top_cells': 'sensitivity',
+    'read_expert_opinions': 'excel_io',
+    'StreamingAggregator': 'streaming',
+    'aggregate_stream': 'streaming',
+    'expert_consistency': 'streaming',
+    'ExpertStore': 'store',
+    'relation_edges': 'render',
+    'relation_threshold': 'threshold',
+    'mmde_threshold': 'threshold',
+    'reachability_matrix': 'ism',
+    'level_partition': 'ism',
+    'ism_analysis': 'ism',
+    'draw_impact_relation_map': 'render',
+    'render_charts': 'charts',
+    'resolve_persian_font': 'fonts',
+    'apply_persian_font': 'fonts',
+    'StageCache': 'pipeline',
+    'StagePipeline': 'pipeline',
+    'build_dematel_pipeline': 'pipeline',
+    'DEMATELFuzzyAnalysis': 'analysis',
+    'ReportWriter': 'report',
+    'ClusterStats': 'clusters',
+    'write_parquet': 'export',
+    'write_feather': 'export',
+    'write_npz': 'export',
+    'solve_bwm': 'bwm',
+    'solve_bwm_batch': 'bwm',
+    'bwm_constraints': 'bwm',
+    'aggregate_weights': 'bwm',
+    'aggregate_bwm_stream': 'bwm',
+    'StreamingWeightAggregator': 'bwm',
+    'perturbation_analysis': 'bwm_perturbation',
+    'WarmStartedBWM': 'bwm_perturbation',
+    'rank_criteria': 'bwm',
+}
+
+__all__ = [
+    'normalize_matrix',
+    'calculate_total_relation_matrix',
+    'influence_degrees',
+    'combine_expert_opinions',
+] + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # فراخوانی‌های بعدی بدون __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
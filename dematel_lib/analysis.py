@@ -0,0 +1,409 @@
+# -*- coding: utf-8 -*-
+"""
+DEMATEL FUZZY Analysis
+کلاس تحلیل نتایج DEMATEL Fuzzy (دسته‌بندی، گزارش و خروجی)
+"""
+
+import numpy as np
+
+from .export import DEFAULT_CHUNK_SIZE, write_feather, write_npz, write_parquet
+from .fuzzy import categorize_net_effect
+from .clusters import VALUE_COLUMNS, ClusterStats
+from .report import ReportWriter
+
+NET_EFFECT_CUTOFF = 0.05
+CATEGORIES = ["Cause (Driver)", "Effect (Consequence)", "Balanced"]
+
+
+class DEMATELFuzzyAnalysis:
+    """
+    کلاس برای تحلیل DEMATEL Fuzzy
+    """
+    
+    def __init__(self, data_dict, threshold_ratio=0.5):
+        """
+        مقداردهی اولیه
+        
+        Parameters:
+        -----------
+        data_dict : dict
+            فرهنگ داده‌های DEMATEL (Factor Code: {D, R, C, NetEffect, Cluster})
+        threshold_ratio : float
+            نسبت آستانه برای Prominence
+        """
+        self.data_dict = data_dict
+        self.threshold_ratio = threshold_ratio
+        import pandas as pd  # بارگذاری تنبل؛ هسته عددی بدون pandas قابل import است
+
+        self.df = pd.DataFrame.from_dict(data_dict, orient='index')
+        self._categorize_factors()
+
+    @property
+    def df(self):
+        """
+        جدول نتایج؛ جایگزینی آن نمایه‌های مرتب‌شده را باطل می‌کند
+        """
+        return self._df
+
+    @df.setter
+    def df(self, frame):
+        self._df = frame
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        باطل کردن نمایه‌های مرتب‌شده و آمار خوشه‌ها (پس از تغییر درجا در self.df باید فراخوانی شود)
+        """
+        self._sorted_cache = {}
+        self._cluster_stats = None
+
+    @property
+    def cluster_stats(self):
+        """
+        آمار خوشه‌ها (ClusterStats)؛ یک بار ساخته و با update_factors به‌روز می‌شود
+        """
+        if self._cluster_stats is None:
+            self._cluster_stats = ClusterStats.from_frame(self._df)
+        return self._cluster_stats
+
+    def update_factors(self, data_dict):
+        """
+        افزودن عوامل جدید یا جایگزینی مقادیر عوامل موجود.
+        فقط همین عوامل دسته‌بندی می‌شوند و آمار خوشه‌ها از مجموع‌های جاری به‌روز می‌شود.
+        :param data_dict: فرهنگ {Factor Code: {D, R, C, NetEffect, Cluster}}
+        """
+        import pandas as pd
+
+        frame = self._df
+        new = pd.DataFrame.from_dict(data_dict, orient='index')
+        labels = categorize_net_effect(new['NetEffect'].to_numpy(dtype=float), NET_EFFECT_CUTOFF)
+        new['Category'] = pd.Categorical(labels, categories=CATEGORIES)
+        if 'Cluster' not in new and 'Cluster' in frame:
+            # بدون کلید Cluster: عوامل موجود خوشه فعلی را نگه می‌دارند و عوامل جدید بدون خوشه‌اند
+            new['Cluster'] = frame['Cluster'].reindex(new.index)
+        elif 'Cluster' in new and 'Cluster' in frame and frame['Cluster'].dtype.name == 'category':
+            missing = pd.Index(new['Cluster'].unique()).difference(frame['Cluster'].cat.categories)
+            if len(missing):
+                frame['Cluster'] = frame['Cluster'].cat.add_categories(missing)
+            new['Cluster'] = pd.Categorical(new['Cluster'], categories=frame['Cluster'].cat.categories)
+
+        existing = new.index[new.index.isin(frame.index)]
+        stats = self._cluster_stats if 'Cluster' in new else None
+        if stats is not None and len(existing):
+            old = frame.loc[existing]
+            stats.remove(old['Cluster'], old[list(VALUE_COLUMNS)].to_numpy(dtype=float), old['Category'])
+        if len(existing):
+            frame.loc[existing, new.columns] = new.loc[existing]
+        added = new.index[~new.index.isin(frame.index)]
+        if len(added):
+            frame = pd.concat([frame, new.loc[added]])
+        if stats is not None:
+            stats.add(new['Cluster'], new[list(VALUE_COLUMNS)].to_numpy(dtype=float), new['Category'])
+
+        self._df = frame
+        self._sorted_cache = {}
+
+    def _sorted_positions(self, column, ascending=True, category=None, cluster=None):
+        """
+        موقعیت سطرهای یک گروه (دسته و/یا خوشه) مرتب‌شده بر اساس ستون، همراه با مقادیر مرتب‌شده.
+        ترتیب کل ستون یک بار با مرتب‌سازی پایدار ساخته می‌شود و هر گروه با یک فیلتر O(n) از آن جدا
+        و در حافظه نگه داشته می‌شود (تساوی‌ها به ترتیب اصلی سطرها، مانند sort_values).
+        :return: (positions، sorted_values)
+        """
+        key = (column, ascending, category, cluster)
+        cached = self._sorted_cache.get(key)
+        if cached is not None:
+            return cached
+
+        values = self._df[column].to_numpy(dtype=float)
+        if category is None and cluster is None:
+            positions = np.argsort(values if ascending else -values, kind='stable')
+        else:
+            positions, _ = self._sorted_positions(column, ascending)
+            mask = np.ones(len(values), dtype=bool)
+            if category is not None:
+                mask &= (self._df['Category'] == category).to_numpy()
+            if cluster is not None:
+                mask &= (self._df['Cluster'] == cluster).to_numpy()
+            positions = positions[mask[positions]]
+        cached = (positions, values[positions])
+        self._sorted_cache[key] = cached
+        return cached
+
+    def top_k(self, k, column='NetEffect', category=None, cluster=None):
+        """
+        k عامل با بیشترین مقدار ستون (در صورت نیاز فقط در یک دسته و/یا خوشه)
+        """
+        positions, _ = self._sorted_positions(column, False, category, cluster)
+        return self._df.iloc[positions[:k]]
+
+    def bottom_k(self, k, column='NetEffect', category=None, cluster=None):
+        """
+        k عامل با کمترین مقدار ستون
+        """
+        positions, _ = self._sorted_positions(column, True, category, cluster)
+        return self._df.iloc[positions[:k]]
+
+    def range_query(self, low, high, column='D', category=None, cluster=None):
+        """
+        عوامل با low <= ستون <= high به ترتیب صعودی، با جستجوی دودویی روی نمایه مرتب‌شده
+        """
+        positions, sorted_values = self._sorted_positions(column, True, category, cluster)
+        start = np.searchsorted(sorted_values, low, side='left')
+        stop = np.searchsorted(sorted_values, high, side='right')
+        return self._df.iloc[positions[start:stop]]
+
+    @classmethod
+    def from_arrays(cls, codes, R, C, clusters=None, cluster_names=None, D=None, NetEffect=None,
+                    threshold_ratio=0.5):
+        """
+        ساخت تحلیل مستقیم از بردارهای درجه (مثلاً خروجی influence_degrees یا batch_total_relation)
+        بدون ساخت دیکشنری برای هر عامل.
+
+        Parameters:
+        -----------
+        codes : array-like or None
+            کد عوامل (None: شماره عامل)
+        R, C : array-like
+            درجه تأثیر و وابستگی
+        clusters : array-like
+            نام خوشه هر عامل، یا کد عددی خوشه همراه با cluster_names
+        cluster_names : sequence
+            نام خوشه‌ها برای کدهای عددی
+        D, NetEffect : array-like
+            در صورت نبود، R + C و R - C محاسبه می‌شوند
+        threshold_ratio : float
+            نسبت آستانه برای Prominence
+        """
+        import pandas as pd
+
+        R = np.asarray(R, dtype=float)
+        C = np.asarray(C, dtype=float)
+        columns = {
+            'D': R + C if D is None else np.asarray(D, dtype=float),
+            'R': R,
+            'C': C,
+            'NetEffect': R - C if NetEffect is None else np.asarray(NetEffect, dtype=float),
+        }
+        if clusters is not None:
+            if cluster_names is not None:
+                columns['Cluster'] = pd.Categorical.from_codes(np.asarray(clusters), cluster_names)
+            else:
+                columns['Cluster'] = pd.Categorical(clusters)
+        index = pd.RangeIndex(len(R)) if codes is None else pd.Index(codes)
+
+        analysis = cls.__new__(cls)
+        analysis.data_dict = None
+        analysis.threshold_ratio = threshold_ratio
+        analysis.df = pd.DataFrame(columns, index=index, copy=False)
+        analysis._categorize_factors()
+        return analysis
+
+    def _categorize_factors(self):
+        """
+        دسته‌بندی برداری عوامل بر اساس Net Effect (±NET_EFFECT_CUTOFF)
+        """
+        import pandas as pd
+
+        labels = categorize_net_effect(self.df['NetEffect'].to_numpy(dtype=float), NET_EFFECT_CUTOFF)
+        self.df['Category'] = pd.Categorical(labels, categories=CATEGORIES)
+        self.invalidate()
+
+    def print_summary(self):
+        """
+        چاپ خلاصه تحلیل
+        """
+        print("=" * 100)
+        print("DEMATEL FUZZY Analysis Summary - خلاصه تحلیل DEMATEL Fuzzy")
+        print("=" * 100)
+        print()
+        
+        print("1. توزیع عوامل بر اساس دسته‌بندی:")
+        print("-" * 100)
+        # ترتیب گزارش مانند ستون متنی (تساوی‌ها به ترتیب اولین ظهور)، بدون دسته‌های خالی
+        category_counts = self.df['Category'].astype(object).value_counts()
+        for category, count in category_counts.items():
+            print(f"  • {category}: {count} عامل")
+        print()
+        
+        print("2. آمار D (Prominence - بروز):")
+        print("-" * 100)
+        print(f"  • بیشترین D: {self.df['D'].max():.4f}")
+        print(f"  • کمترین D: {self.df['D'].min():.4f}")
+        print(f"  • میانگین D: {self.df['D'].mean():.4f}")
+        print(f"  • انحراف معیار D: {self.df['D'].std():.4f}")
+        print()
+        
+        print("3. آمار Net Effect (تأثیر خالص):")
+        print("-" * 100)
+        print(f"  • بیشترین Net Effect: {self.df['NetEffect'].max():.4f} (بیشترین رانش‌دهندگی)")
+        print(f"  • کمترین Net Effect: {self.df['NetEffect'].min():.4f} (بیشترین پیامدی)")
+        print(f"  • میانگین Net Effect: {self.df['NetEffect'].mean():.4f}")
+        print()
+        
+        # محاسبه threshold
+        threshold = self.df['D'].abs().mean() * self.threshold_ratio
+        important_factors = (self.df['D'].abs() > threshold).sum()
+        print(f"4. آستانه معنی‌داری (Threshold):")
+        print("-" * 100)
+        print(f"  • Threshold برای D: {threshold:.4f}")
+        print(f"  • تعداد عوامل معنی‌دار: {important_factors} عامل")
+        print()
+    
+    def print_drivers(self, top_n=None, writer=None):
+        """
+        چاپ عوامل Cause (Driver)
+        """
+        drivers = self.top_k(top_n or None, 'NetEffect', category='Cause (Driver)')
+
+        writer = writer or ReportWriter()
+        writer.heading("CAUSE FACTORS (DRIVERS) - عوامل رانش‌دهنده (درایورها)",
+                       "استراتژی: پیشگیری و کنترل مستقیم")
+        writer.factors(drivers)
+
+    def print_effects(self, writer=None):
+        """
+        چاپ عوامل Effect
+        """
+        effects = self.bottom_k(None, 'NetEffect', category='Effect (Consequence)')
+
+        writer = writer or ReportWriter()
+        writer.heading("EFFECT FACTORS (CONSEQUENCES) - عوامل پیامدی (پیامدها)",
+                       "استراتژی: پایش و کنترل غیرمستقیم")
+        writer.factors(effects)
+
+    def print_balanced(self, writer=None):
+        """
+        چاپ عوامل Balanced
+        """
+        balanced = self.top_k(None, 'D', category='Balanced')
+
+        writer = writer or ReportWriter()
+        writer.heading("BALANCED FACTORS - عوامل متوازن", "استراتژی: مدیریت کامل و یکپارچه")
+        writer.factors(balanced)
+
+    def get_top_drivers(self, n=5):
+        """
+        برگرداندن برتر رانش‌دهندگان
+        """
+        return self.top_k(n, 'NetEffect', category='Cause (Driver)')
+    
+    def get_top_effects(self, n=5):
+        """
+        برگرداندن برتر پیامدها
+        """
+        return self.bottom_k(n, 'NetEffect', category='Effect (Consequence)')
+    
+    def cluster_analysis(self, writer=None):
+        """
+        تحلیل بر اساس خوشه‌ها
+        """
+        writer = writer or ReportWriter()
+        writer.heading("CLUSTER ANALYSIS - تحلیل بر اساس خوشه‌ها")
+        writer.clusters(self.cluster_stats.summary())
+
+    def write_report(self, target, fmt='text', top_n=None, chunk_size=20000):
+        """
+        نوشتن گزارش کامل عوامل (رانش‌دهنده، پیامدی، متوازن و خوشه‌ها) در فایل یا handle.
+        :param target: مسیر فایل یا شیء file-like
+        :param fmt: 'text'، 'markdown' یا 'html'
+        :param top_n: محدودیت تعداد عوامل رانش‌دهنده
+        :param chunk_size: تعداد سطر در هر write
+        """
+        if isinstance(target, (str, bytes)) or hasattr(target, '__fspath__'):
+            with open(target, 'w', encoding='utf-8', buffering=1 << 20) as handle:
+                return self.write_report(handle, fmt, top_n, chunk_size)
+        writer = ReportWriter(target, fmt, chunk_size, title="DEMATEL FUZZY Report")
+        self.print_drivers(top_n=top_n, writer=writer)
+        self.print_effects(writer=writer)
+        self.print_balanced(writer=writer)
+        self.cluster_analysis(writer=writer)
+        writer.close()
+
+    def export_to_csv(self, filename='dematel_results.csv'):
+        """
+        صادرات نتایج به CSV
+        """
+        self.df.to_csv(filename, encoding='utf-8-sig')
+        print(f"نتایج به فایل {filename} صادر شدند.")
+
+    def export_to_parquet(self, filename='dematel_results.parquet', row_group_size=DEFAULT_CHUNK_SIZE):
+        """
+        صادرات نتایج به Parquet (Cluster و Category به صورت dictionary-encoded، نوشتن دسته به دسته)
+        """
+        write_parquet(self.df, filename, row_group_size=row_group_size)
+        print(f"نتایج به فایل {filename} صادر شدند.")
+
+    def export_to_feather(self, filename='dematel_results.feather', chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        صادرات نتایج به Feather v2 (Arrow IPC)
+        """
+        write_feather(self.df, filename, chunk_size=chunk_size)
+        print(f"نتایج به فایل {filename} صادر شدند.")
+
+    def export_to_npz(self, filename='dematel_results.npz', T=None, compressed=False):
+        """
+        صادرات آرایه‌های خام R، C، D، NetEffect (و در صورت وجود ماتریس T) به NPZ
+        """
+        arrays = {name: self.df[name].to_numpy() for name in ('R', 'C', 'D', 'NetEffect')}
+        if self.df.index.dtype.kind not in 'iu':  # کدهای عوامل؛ اندیس عددی (from_arrays بدون codes) لازم نیست
+            arrays['codes'] = self.df.index.to_numpy().astype(str)
+        if 'Cluster' in self.df:
+            cluster = self.df['Cluster'].astype('category')
+            arrays['cluster_codes'] = cluster.cat.codes.to_numpy()
+            arrays['cluster_names'] = cluster.cat.categories.to_numpy().astype(str)
+        write_npz(filename, compressed=compressed, T=T, **arrays)
+        print(f"نتایج به فایل {filename} صادر شدند.")
+
+    def print_methodology(self):
+        """
+        چاپ روش‌شناسی DEMATEL Fuzzy
+        """
+        print("=" * 100)
+        print("DEMATEL FUZZY METHODOLOGY - روش‌شناسی DEMATEL Fuzzy")
+        print("=" * 100)
+        print()
+        
+        methodology = """
+مراحل اجرای DEMATEL Fuzzy:
+
+مرحله 1: تهیه ماتریس مجاورت Fuzzy (Direct Relation Matrix)
+  • هر خبره برای هر جفت (i, j) یک عدد مثلثی Fuzzy وارد کرد
+  • اعداد مثلثی: (Lower, Middle, Upper)
+  • نشان‌دهنده تأثیر عامل i بر عامل j
+
+مرحله 2: Defuzzification (تبدیل اعداد Fuzzy به اعداد دقیق)
+  • فرمول: Defuzzified = (Lower + 4×Middle + Upper) / 6
+  • این روش معیار (Center of Gravity) است
+
+مرحله 3: میانگین‌گیری نظرات خبرگان
+  • میانگین سه ماتریس defuzzified شده از سه خبره
+
+مرحله 4: نرمال‌سازی (Normalization)
+  • تقسیم ماتریس بر ماکزیمم مجموع ردیف‌ها و ستون‌ها
+  • نتیجه: ماتریس نرمال‌شده (Normalized Direct Relation Matrix)
+
+مرحله 5: محاسبه T matrix (Total Relation Matrix)
+  • T = N × (I - N)^(-1)
+  • که N ماتریس نرمال‌شده و I ماتریس یکه است
+
+مرحله 6: محاسبه R و C
+  • R = مجموع ردیف‌های T (Outgoing Influence)
+  • C = مجموع ستون‌های T (Incoming Influence)
+
+مرحله 7: محاسبه D و Net Effect
+  • D = R + C (Prominence)
+  • R - C = Net Effect (Causal Effect)
+
+دسته‌بندی نهایی:
+  • Cause (Driver): R - C > 0.05
+  • Effect (Consequence): R - C < -0.05
+  • Balanced: -0.05 ≤ R - C ≤ 0.05
+
+فواید روش DEMATEL Fuzzy:
+  ✓ مدیریت عدم‌قطعیت نظرات خبرگان
+  ✓ درک عمیق روابط پیچیده بین عوامل
+  ✓ شناسایی عوامل حساس و راننده
+  ✓ کمک به تصمیم‌گیری استراتژیک
+"""
+        print(methodology)
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Bootstrap / Monte-Carlo Confidence Intervals for DEMATEL
+بازه‌های اطمینان و پایداری رتبه برای Prominence (R+C) و Net Effect (R-C)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .batch import normalize_matrices, batch_total_relation
+from .store import ExpertStore
+
+METRICS = ('D', 'NetEffect')
+
+# داده خبرگان در هر پردازه فقط یک بار بارگذاری می‌شود
+_worker_source = None
+
+
+def _init_worker(source):
+    global _worker_source
+    if isinstance(source, str):
+        source = ExpertStore(source).data  # باز کردن memmap به جای کپی کل مکعب در هر پردازه
+    _worker_source = source
+
+
+def sample_triangular(fuzzy_matrix, rng, size):
+    """
+    نمونه‌برداری برداری از توزیع مثلثی (L, M, U) برای هر عنصر ماتریس.
+    :param fuzzy_matrix: آرایه (n, n, 3)
+    :param rng: مولد اعداد تصادفی numpy
+    :param size: تعداد نمونه
+    :return: آرایه (size, n, n)
+    """
+    lower, middle, upper = fuzzy_matrix[..., 0], fuzzy_matrix[..., 1], fuzzy_matrix[..., 2]
+    spread = upper - lower
+    safe_spread = np.where(spread > 0, spread, 1)
+    mode_fraction = (middle - lower) / safe_spread
+    u = rng.random((size,) + lower.shape)
+    # معکوس تابع توزیع تجمعی مثلثی
+    left = lower + np.sqrt(u * spread * (middle - lower))
+    right = upper - np.sqrt((1 - u) * spread * (upper - middle))
+    samples = np.where(u < mode_fraction, left, right)
+    return np.where(spread > 0, samples, middle)
+
+
+def _draw_matrices(source, mode, size, rng):
+    """
+    تولید یک دسته ماتریس تأثیرات اولیه بازنمونه‌گیری‌شده
+    """
+    if mode == 'resample':
+        # بازنمونه‌گیری خبرگان با جایگذاری و میانگین‌گیری (مانند combine_expert_opinions)؛
+        # تعداد انتخاب هر خبره به صورت وزن اعمال می‌شود تا پشته (size, experts, n, n) ساخته نشود
+        n_experts = source.shape[0]
+        weights = rng.multinomial(n_experts, np.full(n_experts, 1 / n_experts), size=size)
+        flat = weights @ source.reshape(n_experts, -1) / n_experts
+        return flat.reshape((size,) + source.shape[1:])
+    elif mode == 'perturb':
+        return sample_triangular(source, rng, size)
+    else:
+        raise ValueError(f"حالت ناشناخته: {mode}")
+
+
+def _ranks(values):
+    """
+    رتبه هر عامل در هر نمونه (رتبه 0 = بزرگ‌ترین مقدار)
+    """
+    order = np.argsort(-values, axis=1)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(values.shape[1])[None, :], axis=1)
+    return ranks
+
+
+def _empty_accumulator(n, bins):
+    return {metric: {
+        'count': 0,
+        'sum': np.zeros(n),
+        'sum_sq': np.zeros(n),
+        'min': np.full(n, np.inf),
+        'max': np.full(n, -np.inf),
+        'histogram': np.zeros((n, bins), dtype=np.int64),
+        'rank_counts': np.zeros((n, n), dtype=np.int64),
+        'spearman_sum': 0.0,
+    } for metric in METRICS}
+
+
+def _accumulate(accumulator, degrees, edges, base_ranks):
+    """
+    افزودن نتایج یک دسته به آمار تجمعی (حافظه مستقل از تعداد نمونه‌ها)
+    """
+    for metric in METRICS:
+        values = degrees[metric]
+        size, n = values.shape
+        state = accumulator[metric]
+        state['count'] += size
+        state['sum'] += values.sum(axis=0)
+        state['sum_sq'] += (values ** 2).sum(axis=0)
+        state['min'] = np.minimum(state['min'], values.min(axis=0))
+        state['max'] = np.maximum(state['max'], values.max(axis=0))
+
+        # هیستوگرام هر عامل روی لبه‌های ثابت
+        low, high = edges[metric]
+        bins = state['histogram'].shape[1]
+        positions = ((values - low) / (high - low) * bins).astype(np.int64)
+        np.clip(positions, 0, bins - 1, out=positions)
+        flat = (np.arange(n)[None, :] * bins + positions).ravel()
+        state['histogram'] += np.bincount(flat, minlength=n * bins).reshape(n, bins)
+
+        # توزیع رتبه و همبستگی اسپیرمن با رتبه‌بندی پایه
+        ranks = _ranks(values)
+        flat = (np.arange(n)[None, :] * n + ranks).ravel()
+        state['rank_counts'] += np.bincount(flat, minlength=n * n).reshape(n, n)
+        squared_shift = ((ranks - base_ranks[metric][None, :]) ** 2).sum(axis=1)
+        state['spearman_sum'] += (1 - 6 * squared_shift / (n * (n ** 2 - 1))).sum()
+    return accumulator
+
+
+def _merge(target, other):
+    for metric in METRICS:
+        a, b = target[metric], other[metric]
+        a['count'] += b['count']
+        a['sum'] += b['sum']
+        a['sum_sq'] += b['sum_sq']
+        a['min'] = np.minimum(a['min'], b['min'])
+        a['max'] = np.maximum(a['max'], b['max'])
+        a['histogram'] += b['histogram']
+        a['rank_counts'] += b['rank_counts']
+        a['spearman_sum'] += b['spearman_sum']
+    return target
+
+
+def _run_chunk(mode, size, seed, edges, base_ranks, bins, source=None):
+    source = _worker_source if source is None else source
+    rng = np.random.default_rng(seed)
+    degrees = batch_total_relation(normalize_matrices(_draw_matrices(source, mode, size, rng)),
+                                   return_total=False, n_jobs=1)
+    return _accumulate(_empty_accumulator(source.shape[1], bins), degrees, edges, base_ranks)
+
+
+def _percentiles(histogram, edges, quantiles):
+    """
+    برآورد صدک‌ها از هیستوگرام تجمعی با درون‌یابی خطی داخل هر بازه
+    """
+    low, high = edges
+    n, bins = histogram.shape
+    width = (high - low) / bins
+    cumulative = np.cumsum(histogram, axis=1)
+    total = cumulative[:, -1:]
+    result = []
+    for q in quantiles:
+        target = q * total
+        index = np.argmax(cumulative >= target, axis=1)
+        before = np.where(index > 0, cumulative[np.arange(n), index - 1], 0)
+        inside = histogram[np.arange(n), index]
+        fraction = np.where(inside > 0, (target[:, 0] - before) / np.maximum(inside, 1), 0.5)
+        result.append(low + (index + fraction) * width)
+    return result
+
+
+def bootstrap_degrees(expert_matrices, n_samples=10000, mode='resample', confidence=0.95,
+                      chunk_size=500, bins=512, n_jobs=None, seed=0):
+    """
+    بازه‌های اطمینان Bootstrap/Monte-Carlo برای R+C و R-C و آمار پایداری رتبه.
+    :param expert_matrices: برای 'resample' آرایه (experts, n, n) یا ExpertStore از ماتریس‌های خبرگان؛
+                            برای 'perturb' آرایه (n, n, 3) یا (experts, n, n, 3) از اعداد مثلثی
+    :param n_samples: تعداد کل نمونه‌ها
+    :param mode: 'resample' (بازنمونه‌گیری خبرگان) یا 'perturb' (نمونه‌برداری از گستره Fuzzy)
+    :param confidence: سطح اطمینان بازه‌ها
+    :param chunk_size: تعداد نمونه در هر دسته (حافظه: chunk_size × n²)
+    :param bins: تعداد بازه‌های هیستوگرام برای برآورد صدک‌ها
+    :param n_jobs: تعداد پردازه‌ها (پیش‌فرض: تعداد هسته‌ها)
+    :param seed: بذر مولد اعداد تصادفی
+    :return: دیکشنری برای هر معیار (D و NetEffect) شامل estimate، mean، std، lower، upper،
+             rank_counts (n×n)، mean_rank، rank_std و spearman
+    """
+    worker_source = None
+    if isinstance(expert_matrices, ExpertStore):
+        worker_source = expert_matrices.path
+        expert_matrices = expert_matrices.data
+    source = np.asarray(expert_matrices, dtype=float)
+    if mode == 'resample':
+        base_matrix = source.mean(axis=0)
+    else:
+        if source.ndim == 4:
+            source = source.mean(axis=0)  # تجمیع اعداد مثلثی خبرگان
+            worker_source = None
+        base_matrix = (source[..., 0] + 4 * source[..., 1] + source[..., 2]) / 6
+    n = base_matrix.shape[0]
+
+    base = batch_total_relation(normalize_matrices(base_matrix[None]), return_total=False)
+    base_ranks = {metric: _ranks(base[metric])[0] for metric in METRICS}
+
+    seeds = np.random.SeedSequence(seed).spawn(int(np.ceil(n_samples / chunk_size)))
+    sizes = [min(chunk_size, n_samples - start) for start in range(0, n_samples, chunk_size)]
+
+    # دسته آزمایشی برای تعیین لبه‌های هیستوگرام
+    rng = np.random.default_rng(seeds[0])
+    pilot = batch_total_relation(normalize_matrices(_draw_matrices(source, mode, sizes[0], rng)),
+                                 return_total=False)
+    edges = {}
+    for metric in METRICS:
+        low, high = pilot[metric].min(), pilot[metric].max()
+        margin = max(high - low, 1e-12)
+        edges[metric] = (low - margin, high + margin)
+    accumulator = _accumulate(_empty_accumulator(n, bins), pilot, edges, base_ranks)
+
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    tasks = list(zip(sizes[1:], seeds[1:]))
+    if n_jobs <= 1 or len(tasks) < 2:
+        for size, chunk_seed in tasks:
+            _merge(accumulator, _run_chunk(mode, size, chunk_seed, edges, base_ranks, bins, source))
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                                 initargs=(worker_source or source,)) as executor:
+            futures = [executor.submit(_run_chunk, mode, size, chunk_seed, edges, base_ranks, bins)
+                       for size, chunk_seed in tasks]
+            for future in futures:
+                _merge(accumulator, future.result())
+
+    alpha = (1 - confidence) / 2
+    results = {'n_samples': n_samples}
+    for metric in METRICS:
+        state = accumulator[metric]
+        count = state['count']
+        mean = state['sum'] / count
+        lower, upper = _percentiles(state['histogram'], edges[metric], (alpha, 1 - alpha))
+        rank_probability = state['rank_counts'] / count
+        positions = np.arange(n)
+        mean_rank = rank_probability @ positions
+        results[metric] = {
+            'estimate': base[metric][0],
+            'mean': mean,
+            'std': np.sqrt(np.maximum(state['sum_sq'] / count - mean ** 2, 0)),
+            'lower': np.clip(lower, state['min'], state['max']),
+            'upper': np.clip(upper, state['min'], state['max']),
+            'rank_counts': state['rank_counts'],
+            'mean_rank': mean_rank + 1,
+            'rank_std': np.sqrt(np.maximum(rank_probability @ positions ** 2 - mean_rank ** 2, 0)),
+            'spearman': state['spearman_sum'] / count,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    import pandas as pd
+
+    # خواندن ماتریس‌های پنج خبره (مانند read_expert_opinions)
+    file_paths = ['expert1.xlsx', 'expert2.xlsx', 'expert3.xlsx', 'expert4.xlsx', 'expert5.xlsx']
+    experts = np.array([
+        pd.read_excel(path, header=None).apply(pd.to_numeric, errors='coerce').fillna(0).values
+        for path in file_paths
+    ])
+
+    bootstrap = bootstrap_degrees(experts, n_samples=20000)
+    for metric in METRICS:
+        summary = bootstrap[metric]
+        print(f"\n{metric}: بازه اطمینان ۹۵٪ و پایداری رتبه (اسپیرمن میانگین: {summary['spearman']:.3f})")
+        for i in range(len(summary['estimate'])):
+            print(f"  C{i + 1}: {summary['estimate'][i]:.4f} "
+                  f"[{summary['lower'][i]:.4f}, {summary['upper'][i]:.4f}] "
+                  f"| رتبه میانگین: {summary['mean_rank'][i]:.1f} ± {summary['rank_std'][i]:.1f}")
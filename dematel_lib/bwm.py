@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+Best-Worst Method (BWM)
+محاسبه وزن معیارها با روش بهترین-بدترین
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def weight_coefficients(best_to_criteria, criteria_to_worst):
+    """
+    ضریب وزن معیار در هر یک از 4n سطر محدودیت: [-a_i, a_i] برای هر معیار و سپس [-1/b_i, 1/b_i].
+    :param best_to_criteria: آرایه (k, n) مقایسه‌های بهترین-به-معیارها
+    :param criteria_to_worst: آرایه (k, n) مقایسه‌های معیارها-به-بدترین
+    :return: آرایه (k, 4n)
+    """
+    k, n = best_to_criteria.shape
+    return np.concatenate([
+        np.stack([-best_to_criteria, best_to_criteria], axis=2).reshape(k, 2 * n),
+        np.stack([-1 / criteria_to_worst, 1 / criteria_to_worst], axis=2).reshape(k, 2 * n),
+    ], axis=1)
+
+
+def bwm_constraints(best_to_criteria, criteria_to_worst):
+    """
+    ساخت یکجای مدل خطی BWM برای یک یا چند خبره (ماتریس محدودیت‌ها به صورت CSR).
+    متغیرهای خبره e: وزن‌ها در ستون‌های e(n+1) تا e(n+1)+n-1 و ε در ستون e(n+1)+n.
+    ترتیب سطرها همان ترتیب حلقه‌ای قبلی است: برای هر معیار دو سطر بهترین-به-معیار،
+    سپس برای هر معیار دو سطر معیار-به-بدترین.
+    :param best_to_criteria: آرایه (n,) یا (k, n) مقایسه‌های بهترین-به-معیارها
+    :param criteria_to_worst: آرایه (n,) یا (k, n) مقایسه‌های معیارها-به-بدترین
+    :return: (c، A_ub، b_ub، A_eq، b_eq) آماده برای linprog
+    """
+    import scipy.sparse as sp  # بارگذاری تنبل scipy
+
+    best = np.atleast_2d(np.asarray(best_to_criteria, dtype=float))
+    worst = np.atleast_2d(np.asarray(criteria_to_worst, dtype=float))
+    if best.shape != worst.shape:
+        raise ValueError("تعداد مقایسه‌های بهترین و بدترین برابر نیست!")
+    k, n = best.shape
+    width = n + 1
+    offsets = (np.arange(k) * width)[:, None]
+
+    coefficients = weight_coefficients(best, worst)
+    weight_columns = np.tile(np.repeat(np.arange(n), 2), 2)[None, :] + offsets
+    epsilon_columns = np.broadcast_to(offsets + n, weight_columns.shape)
+
+    rows = 4 * n * k
+    data = np.stack([coefficients, -np.ones_like(coefficients)], axis=2).ravel()
+    indices = np.stack([weight_columns, epsilon_columns], axis=2).ravel()
+    A_ub = sp.csr_matrix((data, indices, np.arange(0, 2 * rows + 1, 2)), shape=(rows, k * width))
+    b_ub = np.zeros(rows)
+
+    # محدودیت‌های نرمال‌سازی (جمع وزن‌های هر خبره = 1)
+    A_eq = sp.csr_matrix(
+        (np.ones(k * n), (offsets + np.arange(n)).ravel(),
+         np.arange(0, k * n + 1, n)),
+        shape=(k, k * width),
+    )
+    b_eq = np.ones(k)
+
+    c = np.zeros(k * width)
+    c[n::width] = 1  # متغیر ایپسیلون (ε) هر خبره
+    return c, A_ub, b_ub, A_eq, b_eq
+
+
+def _solve_stacked(best_to_criteria, criteria_to_worst):
+    """
+    حل یک دسته از خبرگان با یک مدل بلوک-قطری؛ چون هدف (جمع εها) جدایی‌پذیر است،
+    جواب هر بلوک همان جواب مسئله جداگانه آن خبره است.
+    :return: (وزن‌ها (k, n)، ε* (k,))
+    """
+    from scipy.optimize import linprog  # بارگذاری تنبل scipy
+
+    best = np.atleast_2d(np.asarray(best_to_criteria, dtype=float))
+    k, n = best.shape
+    c, A_ub, b_ub, A_eq, b_eq = bwm_constraints(best, criteria_to_worst)
+    result = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=(0, 1), method='highs')
+    if not result.success:
+        raise ValueError("بهینه‌سازی خطی موفقیت‌آمیز نبود!")
+    solution = result.x.reshape(k, n + 1)
+    return solution[:, :-1], solution[:, -1]
+
+
+def solve_bwm(best_to_criteria, criteria_to_worst, n_criteria):
+    """
+    حل BWM برای یک خبره.
+    :param best_to_criteria: لیست مقایسه‌های بهترین-به-معیارها
+    :param criteria_to_worst: لیست مقایسه‌های معیارها-به-بدترین
+    :param n_criteria: تعداد معیارها
+    :return: وزن نهایی معیارها
+    """
+    weights, _ = _solve_stacked(np.asarray(best_to_criteria)[:n_criteria],
+                                np.asarray(criteria_to_worst)[:n_criteria])
+    return weights[0]
+
+
+def solve_bwm_batch(best_to_criteria_list, criteria_to_worst_list, n_jobs=None,
+                    chunk_size=64, parallel_threshold=512):
+    """
+    حل BWM برای همه خبرگان؛ هر دسته chunk_size خبره در یک مدل خطی بلوک-قطری حل می‌شود
+    و دسته‌ها بین پردازه‌ها تقسیم می‌شوند.
+    :param best_to_criteria_list: آرایه (k, n) مقایسه‌های بهترین-به-معیارها
+    :param criteria_to_worst_list: آرایه (k, n) مقایسه‌های معیارها-به-بدترین
+    :param n_jobs: تعداد پردازه‌ها (پیش‌فرض: تعداد هسته‌ها)
+    :param chunk_size: تعداد خبره در هر مدل خطی
+    :param parallel_threshold: برای k کمتر از این مقدار، محاسبه در همین پردازه انجام می‌شود
+    :return: (وزن‌ها (k, n)، مقدار سازگاری ε* هر خبره (k,))
+    """
+    best = np.asarray(best_to_criteria_list, dtype=float)
+    worst = np.asarray(criteria_to_worst_list, dtype=float)
+    if best.ndim != 2 or best.shape != worst.shape:
+        raise ValueError("ورودی‌ها باید آرایه‌هایی با شکل (k, n) باشند!")
+
+    k = best.shape[0]
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    starts = range(0, k, chunk_size)
+    best_chunks = [best[start:start + chunk_size] for start in starts]
+    worst_chunks = [worst[start:start + chunk_size] for start in starts]
+
+    if k < parallel_threshold or n_jobs <= 1:
+        partials = list(map(_solve_stacked, best_chunks, worst_chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            partials = list(executor.map(_solve_stacked, best_chunks, worst_chunks))
+    weights = np.concatenate([part[0] for part in partials])
+    xi = np.concatenate([part[1] for part in partials])
+    return weights, xi
+
+
+class StreamingWeightAggregator:
+    """
+    تجمیع جریانی وزن‌های BWM با میانگین هندسی (ساده یا وزن‌دار) در فضای لگاریتمی؛
+    حافظه O(n) مستقل از تعداد خبرگان و بدون underflow حاصل‌ضرب وزن‌های کوچک
+    """
+
+    def __init__(self, n_criteria):
+        """
+        Parameters:
+        -----------
+        n_criteria : int
+            تعداد معیارها
+        """
+        self.n_criteria = n_criteria
+        self.n_experts = 0
+        self.total_weight = 0.0  # مجموع وزن خبرگان
+        self._log_sum = np.zeros(n_criteria)  # Σ α_e · log(w_e)
+        self._zero_count = np.zeros(n_criteria, dtype=np.int64)  # وزن صفر: میانگین هندسی صفر
+
+    def update(self, weights, expert_weight=1.0):
+        """
+        افزودن وزن‌های یک خبره
+        :param weights: آرایه (n,) وزن معیارها
+        :param expert_weight: وزن (اهمیت) خبره در میانگین هندسی وزن‌دار
+        """
+        self.update_batch(np.asarray(weights, dtype=float)[None], [expert_weight])
+
+    def update_batch(self, weights, expert_weights=None):
+        """
+        افزودن وزن‌های یک دسته خبره
+        :param weights: آرایه (experts, n)
+        :param expert_weights: آرایه (experts,) وزن خبرگان (پیش‌فرض: همه 1)
+        """
+        weights = np.asarray(weights, dtype=float)
+        if weights.ndim != 2 or weights.shape[1] != self.n_criteria:
+            raise ValueError(f"شکل وزن‌ها {weights.shape} با (experts, {self.n_criteria}) سازگار نیست!")
+        if expert_weights is None:
+            expert_weights = np.ones(len(weights))
+        expert_weights = np.asarray(expert_weights, dtype=float)
+
+        positive = weights > 0
+        self._log_sum += expert_weights @ np.log(np.where(positive, weights, 1.0))
+        self._zero_count += (~positive & (expert_weights[:, None] > 0)).sum(axis=0)
+        self.total_weight += float(expert_weights.sum())
+        self.n_experts += len(weights)
+
+    @property
+    def log_mean(self):
+        """
+        میانگین (وزن‌دار) لگاریتم وزن هر معیار؛ -inf برای معیاری که وزن صفر گرفته است
+        """
+        if self.total_weight <= 0:
+            raise ValueError("هیچ وزنی برای تجمیع وجود ندارد!")
+        return np.where(self._zero_count > 0, -np.inf, self._log_sum / self.total_weight)
+
+    def result(self, normalize=True):
+        """
+        میانگین هندسی وزن‌ها.
+        :param normalize: اگر True باشد نتیجه طوری مقیاس می‌شود که جمع آن 1 شود
+                          (با کم کردن بیشینه لگاریتم پیش از exp، بدون underflow)
+        :return: آرایه (n,)
+        """
+        log_mean = self.log_mean
+        if not normalize:
+            return np.exp(log_mean)
+        scaled = np.exp(log_mean - log_mean.max())
+        return scaled / scaled.sum()
+
+    def top_k(self, k, normalize=True):
+        """
+        k معیار با بیشترین وزن تجمیع‌شده (مانند rank_criteria(weights, k))
+        """
+        return rank_criteria(self.result(normalize), k)
+
+
+def aggregate_weights(weights_list, expert_weights=None, normalize=False):
+    """
+    تجمیع وزن‌ها با میانگین هندسی (در فضای لگاریتمی).
+    :param weights_list: لیست یا آرایه (experts, ...) وزن‌های خبرگان
+    :param expert_weights: وزن اختیاری هر خبره برای میانگین هندسی وزن‌دار
+    :param normalize: اگر True باشد جمع وزن‌های تجمیع‌شده (روی محور آخر) برابر 1 می‌شود
+    :return: وزن‌های تجمیع‌شده
+    """
+    weights_array = np.asarray(weights_list, dtype=float)
+    if expert_weights is None:
+        expert_weights = np.ones(len(weights_array))
+    expert_weights = np.asarray(expert_weights, dtype=float)
+    expert_weights = expert_weights.reshape((-1,) + (1,) * (weights_array.ndim - 1))
+
+    with np.errstate(divide='ignore'):
+        logs = np.log(weights_array)
+    # α·log(0) برای خبره با وزن صفر نباید nan شود
+    log_mean = np.where(expert_weights > 0, expert_weights * logs, 0.0).sum(axis=0) / expert_weights.sum()
+    if not normalize:
+        return np.exp(log_mean)
+    scaled = np.exp(log_mean - log_mean.max(axis=-1, keepdims=True))
+    return scaled / scaled.sum(axis=-1, keepdims=True)
+
+
+def aggregate_bwm_stream(best_to_criteria_list, criteria_to_worst_list, expert_weights=None,
+                         chunk_size=4096, n_jobs=None):
+    """
+    حل و تجمیع دسته به دسته خبرگان؛ وزن‌های هر دسته بلافاصله پس از حل در StreamingWeightAggregator
+    جمع می‌شوند و نگه داشته نمی‌شوند (ورودی می‌تواند memmap باشد).
+    :param best_to_criteria_list: آرایه (k, n) مقایسه‌های بهترین-به-معیارها
+    :param criteria_to_worst_list: آرایه (k, n) مقایسه‌های معیارها-به-بدترین
+    :param expert_weights: وزن اختیاری هر خبره (k,)
+    :param chunk_size: تعداد خبره در هر دسته
+    :param n_jobs: تعداد پردازه‌ها در solve_bwm_batch
+    :return: (StreamingWeightAggregator، مجموع ε*، بیشینه ε*)
+    """
+    k, n = np.shape(best_to_criteria_list)
+    aggregator = StreamingWeightAggregator(n)
+    xi_sum, xi_max = 0.0, 0.0
+    for start in range(0, k, chunk_size):
+        stop = min(start + chunk_size, k)
+        weights, xi = solve_bwm_batch(best_to_criteria_list[start:stop], criteria_to_worst_list[start:stop],
+                                      n_jobs=n_jobs)
+        aggregator.update_batch(weights, None if expert_weights is None else expert_weights[start:stop])
+        xi_sum += float(xi.sum())
+        xi_max = max(xi_max, float(xi.max()))
+    return aggregator, xi_sum, xi_max
+
+
+def rank_criteria(weights, k=None):
+    """
+    رتبه‌بندی معیارها بر اساس وزن نهایی.
+    :param weights: لیست وزن‌های نهایی معیارها
+    :param k: اگر داده شود فقط k معیار برتر با انتخاب جزئی (argpartition) مرتب می‌شوند
+    :return: لیست رتبه‌بندی معیارها
+    """
+    weights = np.asarray(weights)
+    if k is None or k >= len(weights):
+        ranked_indices = np.argsort(weights)[::-1]  # مرتب‌سازی به ترتیب نزولی
+    else:
+        top = np.argpartition(weights, len(weights) - k)[len(weights) - k:]
+        ranked_indices = top[np.argsort(weights[top])[::-1]]
+    ranked_weights = weights[ranked_indices]
+    return ranked_indices, ranked_weights
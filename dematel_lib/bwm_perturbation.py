@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+BWM Perturbation Analysis
+تحلیل پایداری رتبه‌بندی BWM: جابه‌جایی ±step هر قضاوت روی مقیاس 1 تا 9،
+حل دوباره مدل با HiGHS گرم‌شروع (از پایه جواب قبلی) و گزارش توزیع رتبه‌ها و جابه‌جایی جفت معیارها
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .bootstrap import _ranks
+from .bwm import _solve_stacked, aggregate_weights, bwm_constraints, weight_coefficients
+
+
+def _load_highspy():
+    """
+    highspy اختیاری است؛ در نبود آن از linprog (بدون گرم‌شروع) استفاده می‌شود
+    """
+    try:
+        import highspy
+    except ImportError:
+        return None
+    return highspy
+
+
+class WarmStartedBWM:
+    """
+    مدل BWM یک خبره در HiGHS؛ برای هر بردار مقایسه فقط ضرایب وزن‌ها عوض می‌شوند
+    و حل بعدی از پایه (basis) جواب قبلی شروع می‌شود.
+    """
+
+    def __init__(self, n_criteria, highspy=None):
+        """
+        Parameters:
+        -----------
+        n_criteria : int
+            تعداد معیارها
+        highspy : module
+            ماژول highspy (پیش‌فرض: import خودکار)
+        """
+        highspy = highspy or _load_highspy()
+        if highspy is None:
+            raise ImportError("برای گرم‌شروع به بسته highspy نیاز است (pip install highspy)")
+        n = n_criteria
+        c, A_ub, _, A_eq, _ = bwm_constraints(np.ones(n), np.ones(n))
+        matrix = A_ub.tocsr().copy()
+        matrix.resize(4 * n + 1, n + 1)
+        matrix = (matrix + _pad_rows(A_eq, 4 * n)).tocsr()
+
+        self.highs = highspy.Highs()
+        self.highs.setOptionValue('output_flag', False)
+        self.highs.setOptionValue('presolve', 'off')  # presolve پایه قبلی را دور می‌ریزد
+        self._optimal = highspy.HighsModelStatus.kOptimal
+        infinity = highspy.kHighsInf
+        self.highs.addCols(n + 1, c, np.zeros(n + 1), np.ones(n + 1), 0,
+                           np.array([], dtype=np.int32), np.array([], dtype=np.int32), np.array([]))
+        lower = np.append(np.full(4 * n, -infinity), 1.0)
+        upper = np.append(np.zeros(4 * n), 1.0)
+        self.highs.addRows(4 * n + 1, lower, upper, matrix.nnz,
+                           matrix.indptr[:-1].astype(np.int32), matrix.indices.astype(np.int32),
+                           matrix.data)
+        self.n_criteria = n
+        self.rows = np.arange(4 * n)
+        self.columns = np.tile(np.repeat(np.arange(n), 2), 2)
+        self.iterations = 0
+
+    def solve(self, best_to_criteria, criteria_to_worst):
+        """
+        حل مدل برای یک بردار مقایسه.
+        :return: (وزن‌ها (n,)، ε*)
+        """
+        coefficients = weight_coefficients(np.asarray(best_to_criteria, dtype=float)[None],
+                                           np.asarray(criteria_to_worst, dtype=float)[None])[0]
+        for row, column, value in zip(self.rows.tolist(), self.columns.tolist(), coefficients.tolist()):
+            self.highs.changeCoeff(row, column, value)
+        self.highs.run()
+        if self.highs.getModelStatus() != self._optimal:
+            raise ValueError("بهینه‌سازی خطی موفقیت‌آمیز نبود!")
+        self.iterations += self.highs.getInfo().simplex_iteration_count
+        solution = np.array(self.highs.getSolution().col_value)
+        return solution[:-1], solution[-1]
+
+
+def _pad_rows(matrix, before):
+    """
+    قرار دادن سطرهای matrix بعد از before سطر صفر (برای الحاق محدودیت تساوی به A_ub)
+    """
+    import scipy.sparse as sp
+
+    return sp.vstack([sp.csr_matrix((before, matrix.shape[1])), matrix]).tocsr()
+
+
+def perturb_comparisons(best_to_criteria, criteria_to_worst, n_samples, step=1, scale=(1, 9), rng=None):
+    """
+    تولید بردارهای مقایسه جابه‌جاشده؛ هر قضاوت مستقلاً به اندازه یک عدد صحیح در [-step, step]
+    جابه‌جا و به [scale[0], scale[1]] محدود می‌شود. مقایسه خودی بهترین (a_BB) و بدترین (a_WW) معیار
+    ثابت می‌ماند و a_BW که در هر دو بردار آمده (best[w] و worst[b]) جابه‌جایی یکسان می‌گیرد.
+    :return: (best (n_samples, n)، worst (n_samples, n))
+    """
+    rng = np.random.default_rng(rng)
+    base = np.stack([np.asarray(best_to_criteria), np.asarray(criteria_to_worst)]).astype(float)
+    best_index, worst_index = np.argmin(base, axis=1)
+    offsets = rng.integers(-step, step + 1, size=(n_samples,) + base.shape)
+    offsets[:, 1, best_index] = offsets[:, 0, worst_index]
+    perturbed = np.clip(base[None] + offsets, scale[0], scale[1])
+    perturbed[:, 0, best_index] = base[0, best_index]
+    perturbed[:, 1, worst_index] = base[1, worst_index]
+    return perturbed[:, 0], perturbed[:, 1]
+
+
+def _perturb_expert(best_to_criteria, criteria_to_worst, n_samples, step, scale, solver, seed, chunk_size=64):
+    """
+    حل همه بردارهای جابه‌جاشده یک خبره.
+    :return: (وزن‌ها (n_samples, n)، ε* (n_samples,)، تعداد کل تکرارهای simplex یا None)
+    """
+    best, worst = perturb_comparisons(best_to_criteria, criteria_to_worst, n_samples, step, scale,
+                                      np.random.default_rng(seed))
+    if solver == 'highs':
+        model = WarmStartedBWM(best.shape[1])
+        weights = np.empty_like(best)
+        xi = np.empty(n_samples)
+        for index in range(n_samples):
+            weights[index], xi[index] = model.solve(best[index], worst[index])
+        return weights, xi, model.iterations
+
+    # بدون highspy: هر chunk_size بردار در یک مدل بلوک-قطری linprog
+    partials = [_solve_stacked(best[start:start + chunk_size], worst[start:start + chunk_size])
+                for start in range(0, n_samples, chunk_size)]
+    return (np.concatenate([part[0] for part in partials]),
+            np.concatenate([part[1] for part in partials]), None)
+
+
+def _swap_frequency(ranks, base_ranks, chunk_size=512):
+    """
+    نسبت نمونه‌هایی که ترتیب هر جفت معیار در آن‌ها نسبت به رتبه‌بندی پایه برعکس شده است
+    """
+    n = base_ranks.shape[0]
+    base_order = base_ranks[:, None] < base_ranks[None, :]
+    swaps = np.zeros((n, n))
+    for start in range(0, len(ranks), chunk_size):
+        block = ranks[start:start + chunk_size]
+        swaps += ((block[:, :, None] < block[:, None, :]) != base_order).sum(axis=0)
+    np.fill_diagonal(swaps, 0)
+    return swaps / len(ranks)
+
+
+def perturbation_analysis(best_to_criteria_list, criteria_to_worst_list, n_samples=2000, step=1,
+                          scale=(1, 9), solver='auto', n_jobs=None, seed=0):
+    """
+    تحلیل ریسک وارونگی رتبه در BWM.
+    نمونه s ام همه خبرگان با میانگین هندسی (aggregate_weights) تجمیع و سپس رتبه‌بندی می‌شود.
+    :param best_to_criteria_list: آرایه (experts, n) مقایسه‌های بهترین-به-معیارها
+    :param criteria_to_worst_list: آرایه (experts, n) مقایسه‌های معیارها-به-بدترین
+    :param n_samples: تعداد بردار جابه‌جاشده برای هر خبره
+    :param step: بیشینه جابه‌جایی هر قضاوت
+    :param scale: بازه مقیاس قضاوت‌ها
+    :param solver: 'highs' (گرم‌شروع با highspy)، 'linprog' یا 'auto'
+    :param n_jobs: تعداد پردازه‌ها (هر خبره در یک پردازه؛ پیش‌فرض: تعداد هسته‌ها)
+    :param seed: بذر مولد اعداد تصادفی
+    :return: دیکشنری شامل weights و ranking پایه، rank_distribution (n×n: احتمال رتبه r برای معیار i)،
+             mean_rank، rank_std، swap_frequency (n×n)، xi (experts, n_samples)، solver و iterations
+    """
+    best = np.atleast_2d(np.asarray(best_to_criteria_list, dtype=float))
+    worst = np.atleast_2d(np.asarray(criteria_to_worst_list, dtype=float))
+    if best.shape != worst.shape:
+        raise ValueError("تعداد مقایسه‌های بهترین و بدترین برابر نیست!")
+    n_experts, n = best.shape
+
+    if solver == 'auto':
+        solver = 'highs' if _load_highspy() is not None else 'linprog'
+    elif solver not in ('highs', 'linprog'):
+        raise ValueError(f"حل‌کننده ناشناخته: {solver}")
+
+    base_weights, _ = _solve_stacked(best, worst)
+    base_final = aggregate_weights(base_weights)
+    base_ranks = _ranks(base_final[None])[0]
+
+    seeds = np.random.SeedSequence(seed).spawn(n_experts)
+    tasks = [(best[e], worst[e], n_samples, step, scale, solver, seeds[e]) for e in range(n_experts)]
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs <= 1 or n_experts < 2:
+        results = [_perturb_expert(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, n_experts)) as executor:
+            results = list(executor.map(_perturb_expert, *zip(*tasks)))
+
+    weights = np.stack([result[0] for result in results])  # (experts, n_samples, n)
+    ranks = _ranks(aggregate_weights(weights))
+
+    counts = np.bincount((np.arange(n)[None, :] * n + ranks).ravel(), minlength=n * n).reshape(n, n)
+    rank_distribution = counts / n_samples
+    positions = np.arange(n)
+    mean_rank = rank_distribution @ positions
+    iterations = [result[2] for result in results]
+    return {
+        'weights': base_final,
+        'ranking': np.argsort(base_ranks),
+        'rank_distribution': rank_distribution,
+        'mean_rank': mean_rank + 1,
+        'rank_std': np.sqrt(np.maximum(rank_distribution @ positions ** 2 - mean_rank ** 2, 0)),
+        'swap_frequency': _swap_frequency(ranks, base_ranks),
+        'xi': np.stack([result[1] for result in results]),
+        'solver': solver,
+        'iterations': None if None in iterations else int(sum(iterations)),
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(1)
+    n_criteria, n_experts = 22, 5
+    best_list = rng.integers(1, 10, (n_experts, n_criteria))
+    worst_list = rng.integers(1, 10, (n_experts, n_criteria))
+
+    for solver in ('highs', 'linprog'):
+        if solver == 'highs' and _load_highspy() is None:
+            continue
+        start = time.perf_counter()
+        analysis = perturbation_analysis(best_list, worst_list, n_samples=2000, solver=solver, n_jobs=1)
+        print(f"{solver}: {time.perf_counter() - start:.2f} ثانیه | تکرارهای simplex: {analysis['iterations']}")
+
+    upper = np.triu(analysis['swap_frequency'], 1)
+    for flat in np.argsort(upper, axis=None)[::-1][:5]:
+        i, j = np.unravel_index(flat, upper.shape)
+        print(f"معیار {i + 1} ↔ معیار {j + 1}: {upper[i, j]:.1%}")
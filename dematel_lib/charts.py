@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel, Incremental Headless Chart Pipeline
+رسم موازی نمودارها روی backend Agg و رد کردن نمودارهایی که داده و ظاهرشان تغییر نکرده است
+"""
+
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+MANIFEST_FILE = '.chart_manifest.json'
+
+
+def _init_worker():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    plt.switch_backend('Agg')
+
+
+def _render(chart_function, data, path):
+    start = time.perf_counter()
+    chart_function(data, path)
+    return time.perf_counter() - start
+
+
+def source_digest(module_name):
+    """
+    هش فایل منبع یک ماژول (بدون import آن؛ مثلاً 'dematel_lib.fonts')
+    """
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or spec.origin is None:
+        raise ImportError(f"منبع ماژول {module_name} پیدا نشد!")
+    with open(spec.origin, 'rb') as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+def chart_hash(chart_function, data_bytes, style, dependencies=()):
+    """
+    هش ورودی یک نمودار: داده، تنظیمات ظاهری، کد تابع رسم، منبع ماژولی که تابع در آن تعریف شده
+    (توابع کمکی و ثابت‌های هم‌فایل) و منبع ماژول‌های کمکی dependencies
+    """
+    digest = hashlib.sha256()
+    digest.update(data_bytes)
+    digest.update(json.dumps(style, sort_keys=True, default=str).encode('utf-8'))
+    digest.update(inspect.getsource(chart_function).encode('utf-8'))
+    with open(inspect.getsourcefile(chart_function), 'rb') as handle:
+        digest.update(hashlib.sha256(handle.read()).digest())
+    for module_name in dependencies:
+        digest.update(module_name.encode('utf-8'))
+        digest.update(source_digest(module_name).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def render_charts(charts, data, data_bytes, style=None, output_dir='.', n_jobs=None, force=False,
+                  dependencies=()):
+    """
+    رسم مجموعه‌ای از نمودارها، هرکدام در یک پردازه جدا.
+    :param charts: لیست (نام فایل، تابع رسم)؛ تابع رسم به صورت function(data, path) فراخوانی می‌شود
+    :param data: داده ورودی نمودارها (باید قابل pickle باشد)
+    :param data_bytes: نمایش بایتی داده برای محاسبه هش (مثلاً خروجی to_csv)
+    :param style: دیکشنری تنظیمات ظاهری (rcParams، dpi، رنگ‌ها، ...) که در هش وارد می‌شود
+    :param output_dir: پوشه خروجی
+    :param n_jobs: تعداد پردازه‌ها (پیش‌فرض: تعداد هسته‌ها)
+    :param force: رسم دوباره همه نمودارها حتی بدون تغییر
+    :param dependencies: نام ماژول‌های کمکی که توابع رسم از آن‌ها استفاده می‌کنند؛ تغییر منبع آن‌ها همه نمودارها را دوباره رسم می‌کند
+    :return: دیکشنری {نام فایل: زمان رسم بر حسب ثانیه یا None برای نمودار رد شده}
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as handle:
+            manifest = json.load(handle)
+
+    timings = {}
+    pending = {}
+    for filename, chart_function in charts:
+        path = os.path.join(output_dir, filename)
+        digest = chart_hash(chart_function, data_bytes, style or {}, dependencies)
+        if not force and manifest.get(filename) == digest and os.path.exists(path):
+            timings[filename] = None  # بدون تغییر
+        else:
+            pending[filename] = (chart_function, path, digest)
+
+    if pending:
+        if n_jobs is None:
+            n_jobs = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(pending)), initializer=_init_worker) as executor:
+            futures = {filename: executor.submit(_render, chart_function, data, path)
+                       for filename, (chart_function, path, _) in pending.items()}
+            for filename, future in futures.items():
+                timings[filename] = future.result()
+                manifest[filename] = pending[filename][2]
+
+        temporary_path = f"{manifest_path}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as handle:
+            json.dump(manifest, handle, indent=2)
+        os.replace(temporary_path, manifest_path)
+
+    return {filename: timings[filename] for filename, _ in charts}
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Cluster Statistics
+آمار خوشه‌ها (تعداد، میانگین D/R/C/NetEffect و دسته غالب) از مجموع‌های جاری؛
+ساخت اولیه در یک گذر برداری (bincount) و به‌روزرسانی افزایشی هنگام افزودن یا تغییر عوامل
+"""
+
+import numpy as np
+
+VALUE_COLUMNS = ('D', 'R', 'C', 'NetEffect')
+
+
+def _codes(values, names=None):
+    """
+    کد عددی هر مقدار نسبت به فهرست names (نام‌های جدید به انتهای فهرست افزوده می‌شوند).
+    :return: (کدها، فهرست نام‌ها)
+    """
+    import pandas as pd
+
+    names = [] if names is None else list(names)
+    if getattr(values, 'dtype', None) is not None and values.dtype.name == 'category':
+        categories = list(values.cat.categories)
+        codes = values.cat.codes.to_numpy()
+    else:
+        codes, categories = pd.factorize(np.asarray(values, dtype=object))
+        categories = list(categories)
+    lookup = {name: index for index, name in enumerate(names)}
+    for name in categories:
+        if name not in lookup:
+            lookup[name] = len(names)
+            names.append(name)
+    mapping = np.array([lookup[name] for name in categories], dtype=np.intp)
+    return np.where(codes < 0, -1, mapping[codes] if len(mapping) else codes), names
+
+
+class ClusterStats:
+    """
+    آمار تجمعی هر خوشه؛ گزارش (cluster_analysis) و نمودار خوشه‌ها از همین شیء استفاده می‌کنند
+    """
+
+    def __init__(self, clusters=None, categories=None, sort_clusters=True):
+        """
+        Parameters:
+        -----------
+        clusters : sequence
+            ترتیب اولیه نام خوشه‌ها
+        categories : sequence
+            نام دسته‌ها (Cause، Effect، Balanced ...)
+        sort_clusters : bool
+            مرتب‌سازی الفبایی خوشه‌ها در summary (برای ستون Categorical: ترتیب دسته‌های آن)
+        """
+        self.clusters = list(clusters or [])
+        self.categories = list(categories or [])
+        self.sort_clusters = sort_clusters
+        self.count = np.zeros(len(self.clusters), dtype=np.int64)
+        self.sums = np.zeros((len(self.clusters), len(VALUE_COLUMNS)))
+        self.category_counts = np.zeros((len(self.clusters), len(self.categories)), dtype=np.int64)
+
+    @classmethod
+    def from_frame(cls, frame):
+        """
+        ساخت آمار از جدول عوامل (ستون‌های Cluster، Category و D، R، C، NetEffect) در یک گذر
+        """
+        categorical = frame['Cluster'].dtype.name == 'category'
+        stats = cls(sort_clusters=not categorical)
+        stats.add(frame['Cluster'], frame[list(VALUE_COLUMNS)].to_numpy(dtype=float), frame['Category'])
+        return stats
+
+    def _grow(self):
+        """
+        بزرگ کردن آرایه‌ها پس از دیدن خوشه یا دسته جدید
+        """
+        n_clusters, n_categories = len(self.clusters), len(self.categories)
+        extra = n_clusters - len(self.count)
+        if extra:
+            self.count = np.concatenate([self.count, np.zeros(extra, dtype=np.int64)])
+            self.sums = np.vstack([self.sums, np.zeros((extra, len(VALUE_COLUMNS)))])
+        counts = np.zeros((n_clusters, n_categories), dtype=np.int64)
+        counts[:self.category_counts.shape[0], :self.category_counts.shape[1]] = self.category_counts
+        self.category_counts = counts
+
+    def _apply(self, clusters, values, categories, sign):
+        """
+        افزودن (sign=1) یا کم کردن (sign=-1) گروهی از عوامل با bincount
+        """
+        cluster_codes, self.clusters = _codes(clusters, self.clusters)
+        category_codes, self.categories = _codes(categories, self.categories)
+        self._grow()
+        values = np.asarray(values, dtype=float).reshape(len(cluster_codes), len(VALUE_COLUMNS))
+        keep = cluster_codes >= 0
+        cluster_codes, category_codes, values = cluster_codes[keep], category_codes[keep], values[keep]
+
+        n_clusters, n_categories = self.category_counts.shape
+        self.count += sign * np.bincount(cluster_codes, minlength=n_clusters)
+        for column in range(len(VALUE_COLUMNS)):
+            self.sums[:, column] += sign * np.bincount(cluster_codes, values[:, column], minlength=n_clusters)
+        labelled = category_codes >= 0
+        flat = cluster_codes[labelled] * n_categories + category_codes[labelled]
+        self.category_counts += sign * np.bincount(flat, minlength=n_clusters * n_categories).reshape(
+            n_clusters, n_categories)
+
+    def add(self, clusters, values, categories):
+        """
+        افزودن عوامل.
+        :param clusters: نام خوشه هر عامل
+        :param values: آرایه (k, 4) با ستون‌های D، R، C، NetEffect
+        :param categories: دسته هر عامل
+        """
+        self._apply(clusters, values, categories, 1)
+
+    def remove(self, clusters, values, categories):
+        """
+        حذف عواملی که پیش‌تر افزوده شده‌اند (همان مقادیر قبلی)
+        """
+        self._apply(clusters, values, categories, -1)
+
+    def update(self, old, new):
+        """
+        جایگزینی مقادیر عوامل: old و new هر کدام (clusters، values، categories) هستند
+        """
+        self.remove(*old)
+        self.add(*new)
+
+    def summary(self):
+        """
+        جدول آمار خوشه‌های غیرخالی با ستون‌های count، mean_D، mean_R، mean_C، mean_NetEffect و dominant
+        (در تساوی، دسته‌ای که از نظر الفبایی کوچک‌تر است؛ مانند Series.mode()[0])
+        """
+        import pandas as pd
+
+        rows = np.flatnonzero(self.count > 0)
+        if self.sort_clusters:
+            rows = rows[np.argsort([str(self.clusters[row]) for row in rows], kind='stable')]
+        means = self.sums[rows] / self.count[rows, None]
+        order = sorted(range(len(self.categories)), key=lambda index: str(self.categories[index]))
+        dominant = np.array(order, dtype=np.intp)[np.argmax(self.category_counts[rows][:, order], axis=1)] \
+            if order else np.full(len(rows), -1)
+
+        stats = pd.DataFrame({
+            'count': self.count[rows],
+            'mean_D': means[:, 0],
+            'mean_NetEffect': means[:, 3],
+            'mean_R': means[:, 1],
+            'mean_C': means[:, 2],
+            'dominant': [self.categories[index] if index >= 0 else None for index in dominant],
+        }, index=pd.Index([self.clusters[row] for row in rows], name='Cluster'))
+        return stats
+
+
+if __name__ == "__main__":
+    import time
+
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    n = 1000000
+    frame = pd.DataFrame({name: rng.normal(size=n) for name in VALUE_COLUMNS})
+    frame['Cluster'] = rng.choice(['Technical', 'Financial', 'Social', 'Operational'], n)
+    frame['Category'] = np.where(frame['NetEffect'] > 0.05, 'Cause', 'Effect')
+
+    start = time.perf_counter()
+    stats = ClusterStats.from_frame(frame)
+    print(f"ساخت: {time.perf_counter() - start:.3f} ثانیه")
+    start = time.perf_counter()
+    changed = frame.iloc[:100]
+    new_values = changed[list(VALUE_COLUMNS)].to_numpy() + 1.0
+    stats.update((changed['Cluster'], changed[list(VALUE_COLUMNS)].to_numpy(), changed['Category']),
+                 (changed['Cluster'], new_values, changed['Category']))
+    print(f"به‌روزرسانی 100 عامل: {(time.perf_counter() - start) * 1e3:.2f} میلی‌ثانیه")
+    print(stats.summary())
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Cold-start Measurement
+اندازه‌گیری زمان شروع سرد و حافظه (RSS) هر فرایند برای بارگذاری هسته و ماژول‌های سنگین
+
+اجرا:
+    python -m dematel_lib.coldstart
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+# هر سناریو در یک فرایند تازه پایتون اجرا می‌شود
+# (ru_maxrss در لینوکس بیشینه فرایند والد را پیش از exec به ارث می‌برد؛ از VmHWM استفاده می‌شود)
+SCENARIOS = [
+    ('python (baseline)', 'pass'),
+    ('numpy', 'import numpy'),
+    ('dematel_lib core',
+     'import dematel_lib as d; d.normalize_matrix; d.calculate_total_relation_matrix'),
+    ('dematel_lib + solve_bwm', 'import dematel_lib as d; d.solve_bwm'),
+    ('dematel_lib + DEMATELFuzzyAnalysis', 'import dematel_lib as d; d.DEMATELFuzzyAnalysis'),
+    ('dematel_lib.excel_io + openpyxl', 'import dematel_lib.excel_io, openpyxl'),
+    ('dematel_lib.render (matplotlib)', 'import dematel_lib.render'),
+    ('matplotlib + seaborn + pandas', 'import matplotlib.pyplot, seaborn, pandas'),
+]
+
+_PROBE = (
+    "import resource, sys, time\n"
+    "t = time.perf_counter()\n"
+    "{code}\n"
+    "elapsed = time.perf_counter() - t\n"
+    "try:\n"
+    "    with open('/proc/self/status') as f:\n"
+    "        rss = next(int(l.split()[1]) for l in f if l.startswith('VmHWM'))\n"
+    "except OSError:\n"
+    "    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+    "    if sys.platform == 'darwin':\n"
+    "        rss //= 1024\n"
+    "heavy = [m for m in ('matplotlib', 'pandas', 'seaborn', 'scipy', 'openpyxl') if m in sys.modules]\n"
+    "print(elapsed, rss, ','.join(heavy) or '-')\n"
+)
+
+
+def measure(code, repeats=5):
+    """
+    اجرای یک قطعه import در فرایندهای تازه و اندازه‌گیری زمان و حافظه.
+    :param code: کد پایتون مورد اندازه‌گیری
+    :param repeats: تعداد تکرار (میانه گزارش می‌شود)
+    :return: (زمان import به میلی‌ثانیه، بیشینه RSS به مگابایت، ماژول‌های سنگین بارگذاری‌شده)
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root, MPLBACKEND='Agg')
+    times, rss_values, heavy = [], [], '-'
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(code=code)],
+            capture_output=True, text=True, check=True, env=env, cwd=root,
+        ).stdout.split()
+        times.append(float(output[0]) * 1000)
+        rss_values.append(int(output[1]) / 1024)
+        heavy = output[2]
+    return statistics.median(times), statistics.median(rss_values), heavy
+
+
+def main(repeats=5):
+    print(f"{'scenario':<38}{'import ms':>10}{'max RSS MB':>12}  heavy modules")
+    print("-" * 80)
+    for name, code in SCENARIOS:
+        try:
+            elapsed, rss, heavy = measure(code, repeats)
+        except subprocess.CalledProcessError:
+            print(f"{name:<38}{'n/a':>10}{'n/a':>12}  (وابستگی نصب نیست)")
+            continue
+        print(f"{name:<38}{elapsed:>10.1f}{rss:>12.1f}  {heavy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+DEMATEL Numeric Core
+هسته عددی DEMATEL (فقط وابسته به NumPy، بدون چاپ و بدون رسم)
+"""
+
+import numpy as np
+
+
+# مرحله 2: نرمال‌سازی ماتریس تأثیرات اولیه
+def normalize_matrix(direct_matrix):
+    """
+    نرمال‌سازی ماتریس تأثیرات اولیه (تقسیم بر بزرگ‌ترین مجموع سطر).
+    :param direct_matrix: ماتریس تأثیرات اولیه
+    :return: ماتریس نرمال‌شده
+    """
+    direct_matrix = np.asarray(direct_matrix, dtype=float)
+    max_row_sum = np.max(direct_matrix.sum(axis=1))  # مجموع بزرگ‌ترین سطر
+    return direct_matrix / max_row_sum
+
+
+# مرحله 3: محاسبه ماتریس تأثیرات کلی (Total-Relation Matrix)
+def calculate_total_relation_matrix(normalized_matrix):
+    """
+    محاسبه ماتریس تأثیرات کلی T = N(I - N)^-1 با حل دستگاه (I - N) T = N
+    (بدون ساخت ماتریس معکوس صریح).
+    :param normalized_matrix: ماتریس نرمال‌شده N
+    :return: ماتریس تأثیرات کلی T
+    """
+    normalized_matrix = np.asarray(normalized_matrix, dtype=float)
+    n = len(normalized_matrix)
+    I = np.eye(n)  # ماتریس همانی
+    return np.linalg.solve(I - normalized_matrix, normalized_matrix)
+
+
+# مرحله 4: محاسبه درجه تأثیر (R) و وابستگی (C)
+def influence_degrees(total_relation_matrix):
+    """
+    محاسبه R، C، D (R+C) و NetEffect (R-C) از روی ماتریس تأثیرات کلی.
+    :param total_relation_matrix: ماتریس تأثیرات کلی T
+    :return: دیکشنری با کلیدهای R، C، D و NetEffect
+    """
+    degree_influence = total_relation_matrix.sum(axis=1)  # جمع ردیف‌ها
+    degree_dependency = total_relation_matrix.sum(axis=0)  # جمع ستون‌ها
+    return {
+        'R': degree_influence,
+        'C': degree_dependency,
+        'D': degree_influence + degree_dependency,
+        'NetEffect': degree_influence - degree_dependency,
+    }
+
+
+# ترکیب نظرات خبرگان (میانگین‌گیری)
+def combine_expert_opinions(expert_matrices):
+    """
+    میانگین ماتریس‌های خبرگان.
+    :param expert_matrices: لیست یا آرایه (experts, n, n)
+    :return: ماتریس ترکیبی
+    """
+    stacked_matrices = np.array(expert_matrices)
+    return np.mean(stacked_matrices, axis=0)
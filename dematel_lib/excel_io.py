@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Cached, Parallel Expert Workbook Ingestion
+خواندن موازی فایل‌های اکسل خبرگان با حافظه نهان .npy بر اساس هش محتوای فایل
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+DEFAULT_CACHE_DIR = '.dematel_cache'
+CACHE_VERSION = 2  # افزایش آن فایل‌های .npy ساخته‌شده با پارسر قبلی را باطل می‌کند
+
+
+def file_digest(file_path, chunk_size=1 << 20):
+    """
+    هش SHA-256 محتوای فایل (کلید حافظه نهان)
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as handle:
+        for block in iter(lambda: handle.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _to_number(value):
+    """
+    تبدیل مقدار سلول به عدد؛ مقادیر غیر عددی و خالی NaN می‌شوند (مانند pd.to_numeric(..., errors='coerce'))
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            return np.nan
+    return np.nan
+
+
+def parse_workbook(file_path):
+    """
+    خواندن اولین برگه یک فایل اکسل با خواننده read-only (جریانی) openpyxl.
+    :param file_path: مسیر فایل اکسل
+    :return: ماتریس مربعی numpy از مقادیر عددی (سلول‌های خالی یا غیر عددی: NaN)
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = [[_to_number(value) for value in row]
+                for row in workbook.worksheets[0].iter_rows(values_only=True)]
+    finally:
+        workbook.close()
+
+    # حذف سطرها و ستون‌های خالی انتهایی (مانند pd.read_excel؛ سلول‌های قالب‌بندی‌شده بدون مقدار)
+    while rows and all(value != value for value in rows[-1]):
+        rows.pop()
+    width = max((len(row) for row in rows), default=0)
+    matrix = np.full((len(rows), width), np.nan)
+    for i, row in enumerate(rows):
+        matrix[i, :len(row)] = row
+    filled = np.flatnonzero(~np.isnan(matrix).all(axis=0))
+    matrix = matrix[:, :filled[-1] + 1 if len(filled) else 0]
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError(f"ماتریس فایل {file_path} مربعی نیست: {matrix.shape}")
+    return matrix
+
+
+def _parse_and_cache(file_path, cache_path):
+    matrix = parse_workbook(file_path)
+    temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temporary_path, 'wb') as handle:
+        np.save(handle, matrix)
+    os.replace(temporary_path, cache_path)  # نوشتن اتمی برای اجرای هم‌زمان
+    return matrix
+
+
+def _load(file_path, cache_path):
+    if cache_path is None:
+        return parse_workbook(file_path)
+    return _parse_and_cache(file_path, cache_path)
+
+
+def read_expert_opinions(file_paths, cache_dir=DEFAULT_CACHE_DIR, n_jobs=None, missing=0.0, store=None):
+    """
+    خواندن نظرات خبرگان از فایل‌های اکسل با حافظه نهان و پردازش موازی.
+    فایل‌هایی که محتوایشان تغییر نکرده از فایل .npy کناری بارگذاری می‌شوند.
+    :param file_paths: لیست مسیر فایل‌های اکسل
+    :param cache_dir: پوشه فایل‌های .npy؛ اگر None باشد حافظه نهان استفاده نمی‌شود
+    :param n_jobs: تعداد پردازه‌ها برای خواندن فایل‌های تغییر یافته (پیش‌فرض: تعداد هسته‌ها)
+    :param missing: مقدار جایگزین سلول‌های خالی یا غیر عددی؛ np.nan آن‌ها را برای تجمیع جریانی نگه می‌دارد
+    :param store: شیء ExpertStore اختیاری؛ ماتریس فایل‌هایی که (با همین مسیر و محتوا) هنوز در مخزن نیستند به آن افزوده می‌شوند
+    :return: لیست ماتریس‌های numpy (به همان ترتیب file_paths)
+    """
+    file_paths = list(file_paths)
+    expert_matrices = [None] * len(file_paths)
+    digests = [None] * len(file_paths)
+    pending = []
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+    for index, file_path in enumerate(file_paths):
+        cache_path = None
+        if cache_dir is not None or store is not None:
+            digests[index] = file_digest(file_path)
+        if cache_dir is not None:
+            # پسوند .nan: سلول‌های خالی به صورت NaN ذخیره می‌شوند؛ CACHE_VERSION با تغییر parse_workbook
+            cache_path = os.path.join(cache_dir, f"{digests[index]}.nan.v{CACHE_VERSION}.npy")
+            if os.path.exists(cache_path):
+                expert_matrices[index] = np.load(cache_path)
+                continue
+        pending.append((index, file_path, cache_path))
+
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if len(pending) < 2 or n_jobs <= 1:
+        for index, file_path, cache_path in pending:
+            expert_matrices[index] = _load(file_path, cache_path)
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(pending))) as executor:
+            futures = {index: executor.submit(_load, file_path, cache_path)
+                       for index, file_path, cache_path in pending}
+            for index, future in futures.items():
+                expert_matrices[index] = future.result()
+
+    if not np.isnan(missing):
+        expert_matrices = [np.where(np.isnan(matrix), missing, matrix) for matrix in expert_matrices]
+
+    if store is not None:
+        # فقط ورود دوباره همان فایل با همان محتوا نادیده گرفته می‌شود؛ دو خبره با کاربرگ یکسان هر دو ثبت می‌شوند
+        new_items = {}
+        for file_path, digest, matrix in zip(file_paths, digests, expert_matrices):
+            key = (os.path.abspath(file_path), digest)
+            if not store.has_entry(*key) and key not in new_items:
+                new_items[key] = (matrix, os.path.basename(file_path))
+        if new_items:
+            store.append_many([matrix for matrix, _ in new_items.values()],
+                              [expert_id for _, expert_id in new_items.values()],
+                              [digest for _, digest in new_items], sources=[source for source, _ in new_items])
+    return expert_matrices
+
+
+if __name__ == "__main__":
+    import time
+
+    file_paths = ['expert1.xlsx', 'expert2.xlsx', 'expert3.xlsx', 'expert4.xlsx', 'expert5.xlsx']
+    for attempt in ('اجرای اول', 'اجرای دوم (از حافظه نهان)'):
+        start = time.perf_counter()
+        matrices = read_expert_opinions(file_paths)
+        elapsed = time.perf_counter() - start
+        print(f"{attempt}: {len(matrices)} فایل در {elapsed * 1000:.1f} میلی‌ثانیه")
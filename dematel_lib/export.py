@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar Result Export
+صادرات نتایج DEMATEL به Parquet و Feather (Arrow IPC) با ستون‌های Cluster/Category
+به صورت dictionary-encoded و نوشتن دسته به دسته، و NPZ برای آرایه‌های خام R/C/T
+"""
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 100000
+NUMERIC_COLUMNS = ('D', 'R', 'C', 'NetEffect')
+CATEGORICAL_COLUMNS = ('Cluster', 'Category')
+
+
+def _require_pyarrow():
+    """
+    pyarrow فقط برای Parquet/Feather لازم است
+    """
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError("برای صادرات Parquet/Feather به بسته pyarrow نیاز است (pip install pyarrow)") from error
+    return pyarrow
+
+
+def _categorical(series):
+    """
+    کدها و دسته‌های یک ستون (ستون متنی یک بار به Categorical تبدیل می‌شود)
+    """
+    if series.dtype.name != 'category':
+        series = series.astype('category')
+    return series.cat.codes.to_numpy(), series.cat.categories
+
+
+def _column_sources(frame):
+    """
+    آماده‌سازی ستون‌ها برای برش زدن بدون کپی کل جدول
+    """
+    pa = _require_pyarrow()
+    numeric = {name: frame[name].to_numpy(dtype=float) for name in NUMERIC_COLUMNS if name in frame}
+    categorical = {}
+    for name in CATEGORICAL_COLUMNS:
+        if name in frame:
+            codes, categories = _categorical(frame[name])
+            # یک دیکشنری مشترک برای همه دسته‌ها (الزام فایل Arrow IPC)
+            categorical[name] = (codes.astype(np.int32), pa.array(categories.astype(str).tolist(), pa.string()))
+    index = frame.index
+    if index.dtype.kind not in 'iufbM':
+        index = index.astype(str)  # کد عوامل متنی؛ نوع ستون Code بدون دیدن داده‌ها string است
+    return index, numeric, categorical
+
+
+def _schema(index, numeric, categorical):
+    """
+    طرح Arrow جدول از روی نوع ستون‌های frame (نه اولین دسته)، تا جدول خالی هم فایل معتبر بسازد
+    """
+    pa = _require_pyarrow()
+    code_type = pa.from_numpy_dtype(index.dtype) if index.dtype.kind in 'iufbM' else pa.string()
+    fields = [pa.field('Code', code_type)]
+    fields += [pa.field(name, pa.float64()) for name in numeric]
+    fields += [pa.field(name, pa.dictionary(pa.int32(), pa.string())) for name in categorical]
+    return pa.schema(fields)
+
+
+def _record_batches(frame, chunk_size):
+    """
+    طرح Arrow و مولد RecordBatch ها برای هر chunk_size سطر.
+    :return: (schema، iterator)
+    """
+    pa = _require_pyarrow()
+    index, numeric, categorical = _column_sources(frame)
+    schema = _schema(index, numeric, categorical)
+
+    def batches():
+        for start in range(0, len(frame), chunk_size):
+            stop = min(start + chunk_size, len(frame))
+            arrays = [pa.array(index[start:stop].to_numpy(), type=schema.field('Code').type)]
+            arrays += [pa.array(values[start:stop]) for values in numeric.values()]
+            for codes, dictionary in categorical.values():
+                block = codes[start:stop]
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array(block, mask=block < 0), dictionary))  # کد -1 یعنی مقدار گم‌شده
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    return schema, batches()
+
+
+def write_parquet(frame, path, row_group_size=DEFAULT_CHUNK_SIZE, compression='zstd'):
+    """
+    نوشتن جدول نتایج در Parquet؛ هر row_group_size سطر یک row group جدا است.
+    :param frame: DataFrame با اندیس کد عامل و ستون‌های D، R، C، NetEffect، Cluster، Category
+    :param path: مسیر فایل
+    :param row_group_size: تعداد سطر در هر row group (و هر دسته نوشتن)
+    :param compression: الگوریتم فشرده‌سازی Parquet
+    :return: تعداد سطرهای نوشته‌شده
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    schema, batches = _record_batches(frame, row_group_size)
+    rows = 0
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        for batch in batches:
+            writer.write_batch(batch, row_group_size=row_group_size)
+            rows += batch.num_rows
+    return rows
+
+
+def write_feather(frame, path, chunk_size=DEFAULT_CHUNK_SIZE, compression='lz4'):
+    """
+    نوشتن جدول نتایج در Feather v2 (فایل Arrow IPC) دسته به دسته.
+    :param frame: DataFrame نتایج
+    :param path: مسیر فایل
+    :param chunk_size: تعداد سطر در هر record batch
+    :param compression: 'lz4'، 'zstd' یا None
+    :return: تعداد سطرهای نوشته‌شده
+    """
+    pa = _require_pyarrow()
+
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    schema, batches = _record_batches(frame, chunk_size)
+    rows = 0
+    with pa.ipc.new_file(path, schema, options=options) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def write_npz(path, compressed=False, **arrays):
+    """
+    ذخیره آرایه‌های خام (مثلاً R، C، D، NetEffect و ماتریس T) در یک فایل NPZ.
+    :param path: مسیر فایل
+    :param compressed: استفاده از np.savez_compressed
+    :param arrays: آرایه‌ها با نام دلخواه؛ مقادیر None نادیده گرفته می‌شوند
+    """
+    arrays = {name: value for name, value in arrays.items() if value is not None}
+    (np.savez_compressed if compressed else np.savez)(path, **arrays)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    from .analysis import DEMATELFuzzyAnalysis
+
+    rng = np.random.default_rng(0)
+    n = 1000000
+    analysis = DEMATELFuzzyAnalysis.from_arrays(
+        None, rng.normal(size=n), rng.normal(size=n), rng.integers(0, 6, n),
+        cluster_names=['فنی', 'مالی', 'اجتماعی-فرهنگی', 'عملیاتی', 'سازمانی/مدیریتی', 'محیطی/قانونی'])
+    with tempfile.TemporaryDirectory() as directory:
+        for name, export in (('results.csv', analysis.export_to_csv),
+                             ('results.parquet', analysis.export_to_parquet),
+                             ('results.feather', analysis.export_to_feather),
+                             ('results.npz', analysis.export_to_npz)):
+            path = os.path.join(directory, name)
+            start = time.perf_counter()
+            export(path)
+            print(f"{name}: {time.perf_counter() - start:.2f} ثانیه | {os.path.getsize(path) / 1e6:.1f} MB")
+        print(pq.read_table(os.path.join(directory, 'results.parquet')).schema)
+        print(feather.read_table(os.path.join(directory, 'results.feather')).slice(0, 3).to_pandas())
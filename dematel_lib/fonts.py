@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent Persian Font Resolver
+یافتن فونت فارسی با حافظه نهان روی دیسک (بر اساس زمان تغییر پوشه‌های فونت)
+"""
+
+import json
+import os
+import sys
+
+# لیست نام‌های رایج فونت‌های فارسی
+PERSIAN_FONTS = ['Vazirmatn', 'IRANSans', 'BNazanin', 'B Nazanin', 'Shabnam', 'Yekan', 'Tahoma']
+
+CACHE_PATH = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')),
+                          'dematel', 'persian_font.json')
+
+
+def _font_directories():
+    """
+    پوشه‌های فونتی که matplotlib در آن‌ها جستجو می‌کند
+    """
+    from matplotlib import font_manager
+
+    directories = list(font_manager.X11FontDirectories) + list(font_manager.OSXFontDirectories)
+    if sys.platform == 'win32':
+        directories.append(font_manager.win32FontDirectory())
+        local_app_data = os.environ.get('LOCALAPPDATA')
+        if local_app_data:
+            directories.append(os.path.join(local_app_data, 'Microsoft', 'Windows', 'Fonts'))
+    return [os.path.expanduser(directory) for directory in directories]
+
+
+def _directory_signature():
+    """
+    زمان تغییر پوشه‌های فونت و زیرپوشه‌های مستقیم آن‌ها (نصب یا حذف فونت این مقدار را تغییر می‌دهد)
+    """
+    signature = {}
+    for directory in _font_directories():
+        try:
+            signature[directory] = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        signature[entry.path] = entry.stat().st_mtime_ns
+        except OSError:
+            continue
+    return signature
+
+
+def _search(candidates):
+    from matplotlib import font_manager
+
+    for font in font_manager.findSystemFonts():
+        for pf in candidates:
+            if pf.lower() in font.lower():
+                return font
+    return None
+
+
+def resolve_persian_font(candidates=None, cache_path=CACHE_PATH):
+    """
+    مسیر و نام خانواده فونت فارسی؛ فقط در اجرای اول یا پس از تغییر پوشه‌های فونت جستجو می‌شود.
+    :param candidates: لیست نام فونت‌های مورد قبول (پیش‌فرض: PERSIAN_FONTS)
+    :param cache_path: مسیر فایل حافظه نهان؛ اگر None باشد هر بار جستجو می‌شود
+    :return: (مسیر فونت، نام خانواده) یا (None, None) اگر فونتی پیدا نشود
+    """
+    candidates = list(candidates or PERSIAN_FONTS)
+    signature = _directory_signature()
+
+    if cache_path is not None and os.path.exists(cache_path):
+        try:
+            with open(cache_path, encoding='utf-8') as handle:
+                cached = json.load(handle)
+            if cached['candidates'] == candidates and cached['signature'] == signature:
+                return cached['path'], cached['family']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    font_path = _search(candidates)
+    family = None
+    if font_path:
+        from matplotlib import font_manager
+        family = font_manager.FontProperties(fname=font_path).get_name()
+
+    if cache_path is not None:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temporary_path, 'w', encoding='utf-8') as handle:
+                json.dump({'candidates': candidates, 'signature': signature,
+                           'path': font_path, 'family': family}, handle, ensure_ascii=False)
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            pass  # نبود دسترسی نوشتن نباید رسم نمودار را متوقف کند
+    return font_path, family
+
+
+def apply_persian_font(fallback=('DejaVu Sans',), candidates=None):
+    """
+    ثبت فونت فارسی در matplotlib و قرار دادن آن پیش از فونت‌های جایگزین در rcParams
+    :param fallback: فونت‌های جایگزین (مثلاً ['DejaVu Sans'] یا ['Arial'])
+    :return: نام خانواده فونت فارسی یا None
+    """
+    from matplotlib import font_manager, rcParams
+
+    font_path, family = resolve_persian_font(candidates)
+    families = list(fallback)
+    if font_path is not None:
+        font_manager.fontManager.addfont(font_path)
+        families.insert(0, family)
+    rcParams['font.family'] = 'sans-serif'
+    rcParams['font.sans-serif'] = families
+    return family
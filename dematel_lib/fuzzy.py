@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorised Triangular-Fuzzy DEMATEL Engine
+پیاده‌سازی برداری روش‌شناسی DEMATEL Fuzzy (اعداد مثلثی L, M, U)
+"""
+
+import numpy as np
+
+from .batch import batch_total_relation
+
+
+def defuzzify(fuzzy_values):
+    """
+    تبدیل اعداد مثلثی Fuzzy به اعداد دقیق: (Lower + 4×Middle + Upper) / 6
+    :param fuzzy_values: آرایه‌ای که محور آخر آن (L, M, U) است
+    :return: آرایه defuzzified شده (بدون محور آخر)
+    """
+    fuzzy_values = np.asarray(fuzzy_values, dtype=float)
+    return (fuzzy_values[..., 0] + 4 * fuzzy_values[..., 1] + fuzzy_values[..., 2]) / 6
+
+
+def aggregate_fuzzy_opinions(expert_judgments):
+    """
+    میانگین‌گیری نظرات خبرگان برای هر مؤلفه L، M و U.
+    :param expert_judgments: آرایه (experts, n, n, 3)
+    :return: آرایه (n, n, 3)
+    """
+    expert_judgments = np.asarray(expert_judgments, dtype=float)
+    if expert_judgments.ndim != 4 or expert_judgments.shape[-1] != 3:
+        raise ValueError("ورودی باید آرایه‌ای با شکل (experts, n, n, 3) باشد!")
+    return expert_judgments.mean(axis=0)
+
+
+def _max_sum_scale(matrix):
+    """
+    ضریب نرمال‌سازی: ماکزیمم مجموع ردیف‌ها و ستون‌ها
+    """
+    return max(matrix.sum(axis=1).max(), matrix.sum(axis=0).max())
+
+
+def normalize_fuzzy_matrix(fuzzy_matrix):
+    """
+    نرمال‌سازی: تقسیم بر ماکزیمم مجموع ردیف‌ها و ستون‌ها (از مؤلفه Upper).
+    استفاده از یک ضریب برای هر سه مؤلفه، ترتیب L ≤ M ≤ U را حفظ می‌کند.
+    :param fuzzy_matrix: آرایه (n, n, 3)
+    :return: آرایه (n, n, 3) نرمال‌شده
+    """
+    return fuzzy_matrix / _max_sum_scale(fuzzy_matrix[..., 2])
+
+
+def fuzzy_dematel(expert_judgments):
+    """
+    اجرای کامل DEMATEL Fuzzy روی نظرات همه خبرگان.
+    ماتریس‌های Lower، Middle، Upper و ماتریس defuzzified شده در یک حل دسته‌ای محاسبه می‌شوند.
+    :param expert_judgments: آرایه (experts, n, n, 3) از اعداد مثلثی (L, M, U)
+    :return: دیکشنری شامل T_Lower، T_Middle، T_Upper، T (ماتریس دقیق)، R، C، D، NetEffect
+             و کرانه‌های R_Lower..NetEffect_Upper هرکدام با طول n
+    """
+    aggregated = aggregate_fuzzy_opinions(expert_judgments)
+    normalized = normalize_fuzzy_matrix(aggregated)
+
+    # ماتریس دقیق (مراحل 2 تا 4): defuzzify میانگین خبرگان با همان ضریب Upper؛ چون defuzzify خطی است
+    # و T نسبت به N ≥ 0 یکنوا است، کرانه‌ها حفظ می‌شوند: T_Lower ≤ T ≤ T_Upper (و همین‌طور R، C، D)
+    crisp = defuzzify(normalized)
+
+    # پشته (4, n, n): Lower، Middle، Upper و ماتریس دقیق، همه با ضریب مشترک Upper
+    stacked = np.concatenate([np.moveaxis(normalized, -1, 0), crisp[None]])
+    solved = batch_total_relation(stacked)
+
+    results = {
+        'T_Lower': solved['T'][0],
+        'T_Middle': solved['T'][1],
+        'T_Upper': solved['T'][2],
+        'T': solved['T'][3],
+    }
+    for key in ('R', 'C', 'D', 'NetEffect'):
+        results[key] = solved[key][3]
+        results[f'{key}_Lower'] = solved[key][0]
+        results[f'{key}_Middle'] = solved[key][1]
+        results[f'{key}_Upper'] = solved[key][2]
+    return results
+
+
+def categorize_net_effect(net_effect, cutoff=0.05):
+    """
+    دسته‌بندی برداری عوامل بر اساس Net Effect
+    """
+    net_effect = np.asarray(net_effect)
+    return np.select(
+        [net_effect > cutoff, net_effect < -cutoff],
+        ["Cause (Driver)", "Effect (Consequence)"],
+        default="Balanced",
+    )
+
+
+def to_ranking_frame(results, codes, clusters=None):
+    """
+    ساخت جدول رتبه‌بندی با همان ستون‌هایی که dematel_Article.py می‌خواند.
+    :param results: خروجی fuzzy_dematel
+    :param codes: کد عوامل (مثلاً F01)
+    :param clusters: خوشه هر عامل (اختیاری)
+    :return: DataFrame مرتب‌شده بر اساس Net Effect
+    """
+    import pandas as pd
+
+    frame = pd.DataFrame({
+        'Code': codes,
+        'D (Total Importance)': results['D'],
+        'Net Effect (R-C)': results['NetEffect'],
+        'Category': categorize_net_effect(results['NetEffect']),
+        'R (Outgoing Influence)': results['R'],
+        'C (Incoming Influence)': results['C'],
+    })
+    if clusters is not None:
+        frame.insert(2, 'Cluster', clusters)
+    for key in ('R', 'C', 'D'):
+        for bound in ('Lower', 'Middle', 'Upper'):
+            frame[f'{key}_{bound}'] = results[f'{key}_{bound}']
+
+    frame = frame.sort_values('Net Effect (R-C)', ascending=False).reset_index(drop=True)
+    frame.insert(0, 'Rank', np.arange(1, len(frame) + 1))
+    return frame
+
+
+if __name__ == "__main__":
+    # مثال: سه خبره و ۳۶ عامل با اعداد مثلثی (m-1, m, m+1) روی مقیاس 0 تا 4
+    rng = np.random.default_rng(0)
+    middle = rng.integers(0, 5, size=(3, 36, 36)).astype(float)
+    middle[:, np.arange(36), np.arange(36)] = 0
+    judgments = np.stack([np.clip(middle - 1, 0, 4), middle, np.clip(middle + 1, 0, 4)], axis=-1)
+    judgments[:, np.arange(36), np.arange(36)] = 0
+
+    fuzzy_results = fuzzy_dematel(judgments)
+    ranking = to_ranking_frame(fuzzy_results, [f"F{i:02d}" for i in range(1, 37)])
+    print(ranking[['Rank', 'Code', 'D_Lower', 'D (Total Importance)', 'D_Upper', 'Category']].head(10))
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental DEMATEL Total-Relation Updates
+به‌روزرسانی سریع ماتریس تأثیرات کلی پس از اصلاح یک یا چند قضاوت خبره
+(Sherman–Morrison / Woodbury)
+"""
+
+import numpy as np
+
+
+class IncrementalTotalRelation:
+    """
+    کلاس برای نگهداری (I - N)^-1 و به‌روزرسانی افزایشی آن
+
+    چون T = N(I - N)^-1 = (I - N)^-1 - I، با داشتن M = (I - N)^-1 ماتریس T و
+    درجه‌های R و C بدون حل دوباره به‌دست می‌آیند.
+    """
+
+    def __init__(self, direct_matrix, singular_tol=1e-12):
+        """
+        مقداردهی اولیه
+
+        Parameters:
+        -----------
+        direct_matrix : array-like
+            ماتریس تأثیرات اولیه (n×n) پیش از نرمال‌سازی
+        singular_tol : float
+            اگر مخرج فرمول Sherman–Morrison از این مقدار کوچک‌تر شود، محاسبه کامل انجام می‌شود
+        """
+        self.direct_matrix = np.array(direct_matrix, dtype=float)
+        self.singular_tol = singular_tol
+        self.n = self.direct_matrix.shape[0]
+        self.refresh()
+
+    def refresh(self):
+        """
+        محاسبه کامل ضریب نرمال‌سازی و (I - N)^-1 (برای حذف خطای انباشته گرد کردن)
+        """
+        self.row_sums = self.direct_matrix.sum(axis=1)
+        self.scale = self.row_sums.max()  # مجموع بزرگ‌ترین سطر، مانند normalize_matrix
+        self.inverse_matrix = np.linalg.inv(np.eye(self.n) - self.direct_matrix / self.scale)
+
+    def _rescale_if_needed(self):
+        """
+        اگر ضریب نرمال‌سازی تغییر کرده باشد، ماتریس معکوس دوباره ساخته می‌شود
+        """
+        new_scale = self.row_sums.max()
+        if new_scale != self.scale:
+            self.refresh()
+            return True
+        return False
+
+    def update_cell(self, i, j, value):
+        """
+        تغییر یک قضاوت (عنصر (i, j) ماتریس تأثیرات اولیه)
+        """
+        delta = value - self.direct_matrix[i, j]
+        if delta == 0:
+            return
+        self.direct_matrix[i, j] = value
+        self.row_sums[i] += delta
+        if self._rescale_if_needed():
+            return
+
+        # Sherman–Morrison: (I - N - δ e_i e_jᵀ)^-1
+        delta_n = delta / self.scale
+        denominator = 1 - delta_n * self.inverse_matrix[j, i]
+        if abs(denominator) < self.singular_tol:
+            self.refresh()
+            return
+        self.inverse_matrix += (delta_n / denominator) * np.outer(self.inverse_matrix[:, i], self.inverse_matrix[j, :])
+
+    def update_row(self, i, values):
+        """
+        تغییر کل قضاوت‌های یک عامل (سطر i ماتریس تأثیرات اولیه)
+        """
+        values = np.asarray(values, dtype=float)
+        delta_row = values - self.direct_matrix[i]
+        if not delta_row.any():
+            return
+        self.direct_matrix[i] = values
+        self.row_sums[i] = values.sum()
+        if self._rescale_if_needed():
+            return
+
+        # Sherman–Morrison: (I - N - e_i wᵀ)^-1
+        w = delta_row / self.scale
+        w_inverse = w @ self.inverse_matrix
+        denominator = 1 - w_inverse[i]
+        if abs(denominator) < self.singular_tol:
+            self.refresh()
+            return
+        self.inverse_matrix += np.outer(self.inverse_matrix[:, i], w_inverse) / denominator
+
+    def update_cells(self, rows, cols, values):
+        """
+        تغییر هم‌زمان چند قضاوت با یک به‌روزرسانی Woodbury از مرتبه k
+        (برای خانه‌های تکراری فقط آخرین مقدار اعمال می‌شود)
+        """
+        rows = np.asarray(rows).ravel()
+        cols = np.asarray(cols).ravel()
+        values = np.broadcast_to(np.asarray(values, dtype=float), rows.shape)
+        # حذف تکراری‌ها: اولین رخداد در آرایه معکوس = آخرین مقدار هر خانه
+        _, last = np.unique((rows * self.n + cols)[::-1], return_index=True)
+        keep = len(rows) - 1 - last
+        rows, cols, values = rows[keep], cols[keep], values[keep]
+        deltas = values - self.direct_matrix[rows, cols]
+        changed = deltas != 0
+        if not changed.any():
+            return
+        rows, cols, values, deltas = rows[changed], cols[changed], values[changed], deltas[changed]
+        self.direct_matrix[rows, cols] = values
+        np.add.at(self.row_sums, rows, deltas)
+        if self._rescale_if_needed():
+            return
+
+        # Woodbury: (A - U Vᵀ)^-1 = M + M U (I - Vᵀ M U)^-1 Vᵀ M
+        left = self.inverse_matrix[:, rows] * (deltas / self.scale)  # M U
+        right = self.inverse_matrix[cols, :]  # Vᵀ M
+        capacitance = np.eye(len(rows)) - left[cols, :]
+        try:
+            self.inverse_matrix += left @ np.linalg.solve(capacitance, right)
+        except np.linalg.LinAlgError:
+            self.refresh()
+
+    @property
+    def normalized_matrix(self):
+        return self.direct_matrix / self.scale
+
+    @property
+    def total_relation_matrix(self):
+        return self.inverse_matrix - np.eye(self.n)
+
+    def degrees(self):
+        """
+        برگرداندن R، C، D (R+C) و NetEffect (R-C) از روی M = (I - N)^-1
+        """
+        degree_influence = self.inverse_matrix.sum(axis=1) - 1
+        degree_dependency = self.inverse_matrix.sum(axis=0) - 1
+        return {
+            'R': degree_influence,
+            'C': degree_dependency,
+            'D': degree_influence + degree_dependency,
+            'NetEffect': degree_influence - degree_dependency,
+        }
+
+
+if __name__ == "__main__":
+    import time
+
+    # مثال: جلسه what-if با ۵۰۰ عامل
+    rng = np.random.default_rng(0)
+    direct = rng.integers(0, 5, size=(500, 500)).astype(float)
+    np.fill_diagonal(direct, 0)
+
+    model = IncrementalTotalRelation(direct)
+    start = time.perf_counter()
+    for _ in range(100):
+        i, j = rng.integers(0, 500, size=2)
+        model.update_cell(i, j, max(direct[i, j] - 1, 0))  # کاهش یک قضاوت
+    elapsed = (time.perf_counter() - start) / 100
+
+    print(f"میانگین زمان هر به‌روزرسانی: {elapsed * 1000:.2f} میلی‌ثانیه")
+    print("Prominence (R + C) پنج عامل اول:", model.degrees()['D'][:5])
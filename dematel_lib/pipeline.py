@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+"""
+Content-addressed Stage Cache
+اجرای مرحله‌به‌مرحله DEMATEL (خواندن ← ترکیب ← نرمال‌سازی ← ماتریس کل ← درجه‌ها ← دسته‌بندی ← رسم)
+با حافظه نهان روی دیسک؛ کلید هر مرحله هش پارامترها، کد تابع و کلید مراحل ورودی آن است،
+بنابراین با تغییر یک مرحله فقط مراحل پایین‌دست آن دوباره محاسبه می‌شوند.
+"""
+
+import functools
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import pickle
+
+import numpy as np
+
+from .core import (
+    combine_expert_opinions,
+    normalize_matrix,
+    calculate_total_relation_matrix,
+    influence_degrees,
+)
+from .excel_io import DEFAULT_CACHE_DIR, file_digest, read_expert_opinions
+
+DEFAULT_STAGE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'stages')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class StageCache:
+    """
+    حافظه نهان روی دیسک با کلید محتوایی و حذف LRU بر اساس حجم کل
+    """
+
+    def __init__(self, directory=DEFAULT_STAGE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Parameters:
+        -----------
+        directory : str
+            پوشه فایل‌های حافظه نهان (هر مرحله یک فایل {key}.pkl)
+        max_bytes : int
+            بیشینه حجم کل؛ با عبور از آن، فایل‌هایی که دیرتر از همه استفاده شده‌اند حذف می‌شوند
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key):
+        """
+        خواندن مقدار یک کلید و به‌روزرسانی زمان آخرین استفاده آن.
+        :param key: کلید مرحله
+        :return: (found, value)
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as handle:
+                value = pickle.load(handle)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+        os.utime(path)  # ترتیب LRU با زمان تغییر فایل نگه داشته می‌شود
+        return True, value
+
+    def put(self, key, value):
+        """
+        ذخیره اتمی مقدار یک کلید و سپس حذف LRU در صورت عبور از max_bytes.
+        :param key: کلید مرحله
+        :param value: مقدار قابل pickle
+        """
+        path = self._path(key)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, 'wb') as handle:
+            pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+        self.evict(keep=key)
+
+    def evict(self, keep=None):
+        """
+        حذف قدیمی‌ترین فایل‌ها تا رسیدن حجم کل به max_bytes.
+        :param keep: کلیدی که نباید حذف شود (معمولاً همان که تازه نوشته شده)
+        :return: تعداد فایل‌های حذف‌شده
+        """
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith('.pkl'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if keep is not None and path == self._path(keep):
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def size(self):
+        """
+        حجم کل فایل‌های حافظه نهان (بایت)
+        """
+        with os.scandir(self.directory) as scan:
+            return sum(entry.stat().st_size for entry in scan if entry.name.endswith('.pkl'))
+
+
+@functools.lru_cache(maxsize=None)
+def module_digest(module_name):
+    """
+    هش SHA-256 فایل منبع یک زیرماژول dematel_lib (بدون import آن؛ مثلاً 'render' بدون matplotlib)
+    """
+    spec = importlib.util.find_spec(f"{__package__}.{module_name}")
+    return file_digest(spec.origin)
+
+
+def stage_key(name, function, params, input_keys, fingerprint=None, dependencies=()):
+    """
+    کلید محتوایی یک مرحله (هش زنجیره‌ای مانند درخت مرکل).
+    :param name: نام مرحله
+    :param function: تابع مرحله (کد آن در هش وارد می‌شود)
+    :param params: دیکشنری پارامترهای قابل JSON
+    :param input_keys: کلید مراحل ورودی
+    :param fingerprint: هش اضافی داده‌های خارجی (مثلاً هش فایل‌های اکسل)
+    :param dependencies: نام زیرماژول‌هایی که تابع مرحله به آن‌ها واگذار می‌کند؛ تغییر منبع آن‌ها کلید را عوض می‌کند
+    :return: رشته hex
+    """
+    digest = hashlib.sha256()
+    digest.update(name.encode('utf-8'))
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode('utf-8'))
+    digest.update(inspect.getsource(function).encode('utf-8'))
+    for module_name in dependencies:
+        digest.update(module_digest(module_name).encode('ascii'))
+    for key in input_keys:
+        digest.update(key.encode('ascii'))
+    if fingerprint is not None:
+        digest.update(fingerprint.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class StagePipeline:
+    """
+    گراف مراحل با ارزیابی تنبل؛ اگر خروجی یک مرحله در حافظه نهان باشد، مراحل بالادست آن اجرا نمی‌شوند
+    """
+
+    def __init__(self, cache=None):
+        """
+        Parameters:
+        -----------
+        cache : StageCache
+            حافظه نهان مراحل (None: بدون ذخیره روی دیسک)
+        """
+        self.cache = cache
+        self.stages = {}
+        self.executed = []
+        self._values = {}
+
+    def add(self, name, function, inputs=(), params=None, fingerprint=None, validate=None, dependencies=()):
+        """
+        افزودن یک مرحله؛ تابع به صورت function(*ورودی‌ها, **params) فراخوانی می‌شود.
+        :param name: نام یکتای مرحله
+        :param function: تابع مرحله
+        :param inputs: نام مراحل ورودی (باید پیش‌تر افزوده شده باشند)
+        :param params: پارامترهای مرحله
+        :param fingerprint: هش داده‌های خارجی مرحله
+        :param validate: تابع اختیاری برای بررسی اعتبار مقدار حافظه نهان (مثلاً هش فایل خروجی)
+        :param dependencies: زیرماژول‌هایی که منبعشان در کلید وارد می‌شود (نگاه کنید به stage_key)
+        :return: کلید مرحله
+        """
+        params = dict(params or {})
+        inputs = tuple(inputs)
+        key = stage_key(name, function, params, [self.stages[i]['key'] for i in inputs], fingerprint,
+                        dependencies)
+        self.stages[name] = {'function': function, 'inputs': inputs, 'params': params,
+                             'key': key, 'validate': validate}
+        self._values.pop(name, None)
+        return key
+
+    def get(self, name):
+        """
+        مقدار یک مرحله (از حافظه نهان یا با اجرای مرحله و در صورت نیاز مراحل بالادست).
+        :param name: نام مرحله
+        :return: خروجی مرحله
+        """
+        if name in self._values:
+            return self._values[name]
+        stage = self.stages[name]
+        found, value = (False, None) if self.cache is None else self.cache.get(stage['key'])
+        if found and stage['validate'] is not None and not stage['validate'](value):
+            found = False
+        if not found:
+            arguments = [self.get(input_name) for input_name in stage['inputs']]
+            value = stage['function'](*arguments, **stage['params'])
+            if self.cache is not None:
+                self.cache.put(stage['key'], value)
+            self.executed.append(name)
+        self._values[name] = value
+        return value
+
+
+# ---------------------------------------------------------------- مراحل DEMATEL
+
+def read_stage(file_paths, missing=0.0):
+    """
+    مرحله خواندن: آرایه (experts, n, n) نظرات خبرگان
+    """
+    return np.stack(read_expert_opinions(file_paths, missing=missing))
+
+
+def combine_stage(expert_matrices):
+    """
+    مرحله ترکیب نظرات خبرگان (میانگین)
+    """
+    return combine_expert_opinions(expert_matrices)
+
+
+def total_relation_stage(normalized_matrix):
+    """
+    مرحله ماتریس تأثیرات کلی T
+    """
+    return calculate_total_relation_matrix(normalized_matrix)
+
+
+def categorize_stage(total_relation_matrix, degrees, cutoff=0.0, threshold_method='mean'):
+    """
+    مرحله دسته‌بندی: آستانه رسم ('mean' یا 'mmde')، دسته علی/معلولی و ترتیب عوامل بر اساس R + C
+    """
+    from .fuzzy import categorize_net_effect
+    from .threshold import relation_threshold
+
+    return {
+        'threshold': relation_threshold(total_relation_matrix, threshold_method),
+        'category': categorize_net_effect(degrees['NetEffect'], cutoff),
+        'ranking': np.argsort(-degrees['D'], kind='stable'),
+    }
+
+
+def render_stage(total_relation_matrix, degrees, categories, output_path,
+                 figsize=(15, 15), point_size=1000, dpi=100,
+                 title='Dependency and Independency Analysis with Directed Arrows'):
+    """
+    مرحله رسم نقشه روابط تأثیر در فایل؛ روی یک Figure مستقل با FigureCanvasAgg رسم می‌شود
+    تا backend و وضعیت pyplot فرایند فراخواننده دست نخورد
+    :return: دیکشنری شامل path (مسیر فایل خروجی) و digest (هش محتوای آن)
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from .render import draw_impact_relation_map
+
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    draw_impact_relation_map(degrees['D'], degrees['NetEffect'], total_relation_matrix,
+                             threshold=categories['threshold'], ax=ax, point_size=point_size)
+    ax.set_title(title)
+    ax.set_xlabel('Dependency (R + D)')
+    ax.set_ylabel('Independency (R - D)')
+    ax.grid()
+    ax.axhline(0, color='black', lw=1)
+    ax.axvline(0, color='black', lw=1)
+    ax.legend()
+    figure.savefig(output_path, dpi=dpi)
+    return {'path': output_path, 'digest': file_digest(output_path)}
+
+
+def output_unchanged(value):
+    """
+    اعتبار خروجی فایلی حافظه نهان: فایل هنوز وجود دارد و همان محتوایی است که این مرحله نوشته
+    (نه نسخه‌ای که اجرای دیگری با پارامترهای متفاوت روی همان مسیر نوشته است)
+    """
+    try:
+        return file_digest(value['path']) == value['digest']
+    except (OSError, TypeError, KeyError):
+        return False
+
+
+def build_dematel_pipeline(file_paths, cache=None, missing=0.0, cutoff=0.0,
+                           output_path='dematel_impact_relation_map.png', plot=None, threshold_method='mean'):
+    """
+    ساخت گراف مراحل DEMATEL از فایل‌های اکسل خبرگان.
+    :param file_paths: لیست مسیر فایل‌های اکسل
+    :param cache: StageCache (پیش‌فرض: StageCache() در .dematel_cache/stages)
+    :param missing: مقدار جایگزین سلول‌های خالی
+    :param cutoff: آستانه Net Effect برای دسته‌بندی علی/معلولی
+    :param output_path: مسیر فایل نقشه روابط
+    :param plot: دیکشنری تنظیمات رسم (figsize، point_size، dpi، title)
+    :param threshold_method: آستانه روابط نقشه: 'mean' (میانگین T) یا 'mmde'
+    :return: StagePipeline با مراحل read، combine، normalize، total_relation، degrees، categorize، render
+    """
+    file_paths = list(file_paths)
+    pipeline = StagePipeline(StageCache() if cache is None else cache)
+    # هش محتوای فایل‌ها در کلید مرحله خواندن؛ ویرایش یک فایل همه مراحل پایین‌دست را باطل می‌کند
+    fingerprint = ','.join(file_digest(path) for path in file_paths)
+    pipeline.add('read', read_stage, params={'file_paths': file_paths, 'missing': missing},
+                 fingerprint=fingerprint, dependencies=['excel_io'])
+    pipeline.add('combine', combine_stage, ['read'], dependencies=['core'])
+    pipeline.add('normalize', normalize_matrix, ['combine'])
+    pipeline.add('total_relation', total_relation_stage, ['normalize'], dependencies=['core'])
+    pipeline.add('degrees', influence_degrees, ['total_relation'])
+    pipeline.add('categorize', categorize_stage, ['total_relation', 'degrees'],
+                 params={'cutoff': cutoff, 'threshold_method': threshold_method},
+                 dependencies=['fuzzy', 'threshold'])
+    pipeline.add('render', render_stage, ['total_relation', 'degrees', 'categorize'],
+                 params=dict(plot or {}, output_path=output_path), validate=output_unchanged,
+                 dependencies=['render', 'threshold'])
+    return pipeline
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    file_paths = [f'expert{i}.xlsx' for i in range(1, 6)]
+    with tempfile.TemporaryDirectory() as directory:
+        cache = StageCache(directory)
+        for plot in ({'point_size': 1000}, {'point_size': 1000}, {'point_size': 600}):
+            start = time.perf_counter()
+            pipeline = build_dematel_pipeline(file_paths, cache=cache, plot=plot,
+                                              output_path=os.path.join(directory, 'map.png'))
+            pipeline.get('render')
+            print(f"{plot} | اجرا شده: {pipeline.executed or '-'} | "
+                  f"زمان: {time.perf_counter() - start:.3f} ثانیه | حجم: {cache.size()} بایت")
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorised DEMATEL Impact-Relation Map Renderer
+رسم برداری نقشه روابط تأثیر: همه فلش‌ها و برچسب‌ها هرکدام در یک artist
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection, PathCollection, PolyCollection
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
+
+from .threshold import relation_threshold
+
+
+def relation_edges(prominence, net_effect, total_relation_matrix, threshold=None, circle_radius=0.0):
+    """
+    محاسبه برداری هندسه فلش‌ها (برش خورده در لبه دایره‌ها).
+    :param prominence: R + C هر عامل (محور x)
+    :param net_effect: R - C هر عامل (محور y)
+    :param total_relation_matrix: ماتریس تأثیرات کلی T
+    :param threshold: فقط روابط بزرگ‌تر از این مقدار، یا نام روش 'mean' / 'mmde' (پیش‌فرض: میانگین T)
+    :param circle_radius: شعاع دایره هر عامل؛ فلش‌ها از لبه دایره شروع و به لبه دایره ختم می‌شوند
+    :return: (start, end, sources, targets) که start و end آرایه‌های (m, 2) هستند
+    """
+    x = np.asarray(prominence, dtype=float)
+    y = np.asarray(net_effect, dtype=float)
+    total_relation_matrix = np.asarray(total_relation_matrix)
+    if threshold is None:
+        threshold = 'mean'
+    if isinstance(threshold, str):
+        threshold = relation_threshold(total_relation_matrix, threshold)
+
+    sources, targets = np.nonzero(total_relation_matrix > threshold)
+    dx = x[targets] - x[sources]
+    dy = y[targets] - y[sources]
+    distance = np.hypot(dx, dy)
+    keep = distance > circle_radius  # فاصله کافی برای رسم فلش
+    sources, targets = sources[keep], targets[keep]
+    dx, dy, distance = dx[keep], dy[keep], distance[keep]
+
+    reduction_factor = (circle_radius / distance)[:, None]
+    delta = np.column_stack([dx, dy])
+    start = np.column_stack([x[sources], y[sources]]) + delta * reduction_factor
+    end = np.column_stack([x[targets], y[targets]]) - delta * reduction_factor
+    return start, end, sources, targets
+
+
+def _arrow_heads(start, end, head_width, head_length):
+    """
+    مثلث سر فلش‌ها با نوک روی نقطه پایان (آرایه (m, 3, 2))
+    """
+    direction = end - start
+    length = np.hypot(direction[:, 0], direction[:, 1])[:, None]
+    unit = direction / np.where(length > 0, length, 1)
+    normal = np.column_stack([-unit[:, 1], unit[:, 0]])
+    base = end - unit * np.minimum(head_length, length)
+    return np.stack([end, base + normal * head_width / 2, base - normal * head_width / 2], axis=1)
+
+
+def _label_collection(ax, x, y, labels, fontsize, color):
+    """
+    همه برچسب‌ها به صورت یک PathCollection (به جای یک plt.text برای هر عامل)
+    """
+    paths = []
+    for label in labels:
+        path = TextPath((0, 0), str(label), size=fontsize)
+        extents = path.get_extents()
+        paths.append(path.transformed(Affine2D().translate(-(extents.x0 + extents.x1) / 2,
+                                                           -(extents.y0 + extents.y1) / 2)))
+    # مسیرها بر حسب point هستند؛ offsetها در مختصات داده
+    points_to_display = Affine2D().scale(1 / 72) + ax.figure.dpi_scale_trans
+    collection = PathCollection(paths, offsets=np.column_stack([x, y]), offset_transform=ax.transData,
+                                facecolors=color, edgecolors='none', transform=points_to_display)
+    ax.add_collection(collection)
+    return collection
+
+
+def draw_impact_relation_map(prominence, net_effect, total_relation_matrix, threshold=None, labels=None,
+                             ax=None, point_size=1000, head_width=0.05, head_length=0.05,
+                             color='blue', arrow_color='black', alpha=0.7, fontsize=12):
+    """
+    رسم نقشه روابط تأثیر (Impact-Relation Map) با فلش‌های جهت‌دار.
+    :param prominence: R + C هر عامل
+    :param net_effect: R - C هر عامل
+    :param total_relation_matrix: ماتریس تأثیرات کلی T
+    :param threshold: آستانه رسم روابط یا نام روش 'mean' / 'mmde' (پیش‌فرض: میانگین T)
+    :param labels: برچسب عوامل (پیش‌فرض: C1، C2، ...)
+    :param ax: محور matplotlib (پیش‌فرض: محور فعلی)
+    :param point_size: اندازه نقاط (مانند s در plt.scatter)
+    :return: دیکشنری artistها (points، edges، heads، labels)
+    """
+    if ax is None:
+        ax = plt.gca()
+    x = np.asarray(prominence, dtype=float)
+    y = np.asarray(net_effect, dtype=float)
+    if labels is None:
+        labels = [f"C{i}" for i in range(1, len(x) + 1)]
+
+    circle_radius = np.sqrt(point_size / np.pi) / 100  # شعاع دایره (براساس اندازه نقاط)
+    points = ax.scatter(x, y, color=color, s=point_size, label='Challenges')
+
+    start, end, _, _ = relation_edges(x, y, total_relation_matrix, threshold, circle_radius)
+    edges = LineCollection(np.stack([start, end], axis=1), colors=arrow_color, alpha=alpha)
+    heads = PolyCollection(_arrow_heads(start, end, head_width, head_length),
+                           facecolors=arrow_color, edgecolors=arrow_color, alpha=alpha)
+    ax.add_collection(edges)
+    ax.add_collection(heads)
+
+    text = _label_collection(ax, x, y, labels, fontsize, 'white')
+    ax.autoscale_view()
+    return {'points': points, 'edges': edges, 'heads': heads, 'labels': text}
+
+
+if __name__ == "__main__":
+    import time
+    from .batch import normalize_matrices, batch_total_relation
+
+    # مثال: نقشه ۳۰۰ عاملی
+    rng = np.random.default_rng(0)
+    direct = rng.integers(0, 5, size=(300, 300)).astype(float)
+    np.fill_diagonal(direct, 0)
+    result = batch_total_relation(normalize_matrices(direct[None]))
+
+    start_time = time.perf_counter()
+    plt.figure(figsize=(15, 15))
+    artists = draw_impact_relation_map(result['D'][0], result['NetEffect'][0], result['T'][0], fontsize=6)
+    plt.savefig('impact_relation_map.png', dpi=100)
+    elapsed = time.perf_counter() - start_time
+    print(f"تعداد فلش‌ها: {len(artists['edges'].get_segments())} | زمان رسم: {elapsed:.2f} ثانیه")
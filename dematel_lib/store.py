@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Memory-Mapped Expert Tensor Store
+ذخیره‌سازی مکعب نظرات خبرگان (experts × n × n [× 3]) روی دیسک با np.memmap
+"""
+
+import json
+import os
+
+import numpy as np
+
+HEADER_FILE = 'header.json'
+DATA_FILE = 'experts.bin'
+
+
+class ExpertStore:
+    """
+    کلاس برای نگهداری ماتریس‌های خبرگان روی دیسک و دسترسی تصادفی بدون کپی
+
+    ساختار پوشه:
+      header.json : متادیتا (n، fuzzy، کد عوامل، خوشه‌ها، شناسه خبرگان)
+      experts.bin : داده خام float64 با ترتیب C، هر خبره پشت سر قبلی
+    """
+
+    def __init__(self, path, n_factors=None, fuzzy=False, factor_codes=None, clusters=None):
+        """
+        باز کردن یک مخزن موجود یا ساخت مخزن جدید
+
+        Parameters:
+        -----------
+        path : str
+            پوشه مخزن
+        n_factors : int
+            تعداد عوامل (فقط برای ساخت مخزن جدید لازم است)
+        fuzzy : bool
+            اگر True باشد هر خبره آرایه (n, n, 3) از اعداد مثلثی دارد
+        factor_codes : list
+            کد عوامل (مثلاً F01)
+        clusters : list
+            برچسب خوشه هر عامل
+        """
+        self.path = path
+        self._data = None
+        header_path = os.path.join(path, HEADER_FILE)
+        if os.path.exists(header_path):
+            with open(header_path, encoding='utf-8') as handle:
+                self.header = json.load(handle)
+        else:
+            if n_factors is None:
+                raise ValueError("برای ساخت مخزن جدید باید n_factors مشخص شود!")
+            os.makedirs(path, exist_ok=True)
+            self.header = {
+                'n_factors': int(n_factors),
+                'fuzzy': bool(fuzzy),
+                'dtype': 'float64',
+                'count': 0,
+                'factor_codes': list(factor_codes) if factor_codes is not None else None,
+                'clusters': list(clusters) if clusters is not None else None,
+                'expert_ids': [],
+                'digests': [],
+                'sources': [],
+            }
+            open(os.path.join(path, DATA_FILE), 'wb').close()
+            self._write_header()
+        # مخزن‌های قدیمی‌تر منبع را ثبت نکرده‌اند؛ شناسه خبره جای آن را می‌گیرد
+        self.header.setdefault('sources', list(self.header['expert_ids']))
+        # مجموعه‌ها برای بررسی عضویت O(1)؛ فهرست‌های header ترتیب خبرگان را نگه می‌دارند
+        self._digests = {digest for digest in self.header['digests'] if digest is not None}
+        self._entries = {(source, digest) for source, digest in zip(self.header['sources'], self.header['digests'])
+                         if digest is not None}
+
+    def _write_header(self):
+        header_path = os.path.join(self.path, HEADER_FILE)
+        temporary_path = f"{header_path}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as handle:
+            json.dump(self.header, handle, ensure_ascii=False)
+        os.replace(temporary_path, header_path)
+
+    @property
+    def matrix_shape(self):
+        n = self.header['n_factors']
+        return (n, n, 3) if self.header['fuzzy'] else (n, n)
+
+    @property
+    def factor_codes(self):
+        return self.header['factor_codes']
+
+    @property
+    def clusters(self):
+        return self.header['clusters']
+
+    @property
+    def expert_ids(self):
+        return self.header['expert_ids']
+
+    def __len__(self):
+        return self.header['count']
+
+    def __contains__(self, digest):
+        return digest in self._digests
+
+    def has_entry(self, source, digest):
+        """
+        آیا همین منبع با همین محتوا قبلاً افزوده شده است (دو خبره با فایل یکسان دو ورودی جدا هستند)
+        """
+        return (source, digest) in self._entries
+
+    @property
+    def data(self):
+        """
+        نمای memmap فقط‌خواندنی از کل مکعب (experts, n, n[, 3])
+        """
+        count = self.header['count']
+        if self._data is None or self._data.shape[0] != count:
+            if count == 0:
+                return np.empty((0,) + self.matrix_shape)
+            self._data = np.memmap(os.path.join(self.path, DATA_FILE), dtype=self.header['dtype'],
+                                   mode='r', shape=(count,) + self.matrix_shape)
+        return self._data
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def flush(self):
+        """
+        نوشتن header (پس از append با flush=False)
+        """
+        self._write_header()
+
+    def append(self, matrix, expert_id=None, digest=None, flush=True, source=None):
+        """
+        افزودن ماتریس یک خبره به انتهای مخزن
+        :param matrix: ماتریس با شکل matrix_shape
+        :param expert_id: شناسه خبره (پیش‌فرض: شماره ترتیبی)
+        :param digest: هش فایل منبع برای جلوگیری از افزودن تکراری
+        :param flush: نوشتن فوری header؛ برای افزودن‌های پشت سر هم False و در پایان flush()
+        :param source: مسیر فایل منبع (پیش‌فرض: expert_id)
+        """
+        self.append_many([matrix], [expert_id], [digest], flush=flush, sources=[source])
+
+    def append_many(self, matrices, expert_ids=None, digests=None, flush=True, sources=None):
+        """
+        افزودن چند خبره با یک بار باز کردن فایل داده و یک بار نوشتن header.
+        همه شکل‌ها پیش از نوشتن بررسی می‌شوند و در صورت خطای نوشتن، header حافظه به حالت قبل برمی‌گردد.
+        :param matrices: دنباله ماتریس‌ها با شکل matrix_shape
+        :param expert_ids: شناسه هر خبره (None: شماره ترتیبی)
+        :param digests: هش فایل منبع هر خبره
+        :param flush: نوشتن header پس از افزودن
+        :param sources: مسیر فایل منبع هر خبره (None: شناسه خبره)
+        """
+        matrices = [np.ascontiguousarray(matrix, dtype=self.header['dtype']) for matrix in matrices]
+        for matrix in matrices:
+            if matrix.shape != self.matrix_shape:
+                raise ValueError(f"شکل ماتریس {matrix.shape} با {self.matrix_shape} یکسان نیست!")
+        count = self.header['count']
+        expert_ids = [None] * len(matrices) if expert_ids is None else list(expert_ids)
+        expert_ids = [expert_id if expert_id is not None else str(count + offset)
+                      for offset, expert_id in enumerate(expert_ids)]
+        digests = [None] * len(matrices) if digests is None else list(digests)
+        sources = [None] * len(matrices) if sources is None else list(sources)
+        sources = [source if source is not None else expert_id for source, expert_id in zip(sources, expert_ids)]
+
+        item_bytes = int(np.prod(self.matrix_shape)) * np.dtype(self.header['dtype']).itemsize
+        with open(os.path.join(self.path, DATA_FILE), 'r+b') as handle:
+            # داده‌های بعد از آخرین header ثبت‌شده (مثلاً از اجرای قطع‌شده) بازنویسی می‌شوند
+            handle.seek(count * item_bytes)
+            for matrix in matrices:
+                handle.write(matrix.tobytes())
+            handle.truncate()
+        self.header['expert_ids'].extend(expert_ids)
+        self.header['digests'].extend(digests)
+        self.header['sources'].extend(sources)
+        self.header['count'] = count + len(matrices)
+        self._digests.update(digest for digest in digests if digest is not None)
+        self._entries.update((source, digest) for source, digest in zip(sources, digests) if digest is not None)
+        if flush:
+            self._write_header()
+
+    def iter_chunks(self, chunk_size=256):
+        """
+        پیمایش مکعب در دسته‌های پشت سر هم (نماهای memmap بدون کپی)
+        """
+        data = self.data
+        for start in range(0, len(self), chunk_size):
+            yield data[start:start + chunk_size]
+
+
+if __name__ == "__main__":
+    from .excel_io import read_expert_opinions
+    from .streaming import StreamingAggregator, expert_consistency
+
+    file_paths = ['expert1.xlsx', 'expert2.xlsx', 'expert3.xlsx', 'expert4.xlsx', 'expert5.xlsx']
+    store = ExpertStore('expert_store', n_factors=23, factor_codes=[f"C{i}" for i in range(1, 24)])
+    read_expert_opinions(file_paths, store=store)
+
+    aggregator = StreamingAggregator(store.matrix_shape)
+    for chunk in store.iter_chunks(chunk_size=2):
+        aggregator.update_batch(chunk)
+
+    print(f"تعداد خبرگان در مخزن: {len(store)}")
+    print("Combined Expert Opinions Matrix (سه سطر اول):\n", aggregator.result()[:3])
+    for expert_id, deviation in zip(store.expert_ids, expert_consistency(store.data)):
+        print(f"  {expert_id}: فاصله از اجماع = {deviation:.4f}")
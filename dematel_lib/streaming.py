@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming Aggregation of Expert Opinions
+تجمیع جریانی نظرات خبرگان با حافظه O(n²) (میانگین حسابی، هندسی و واریانس Welford)
+"""
+
+import numpy as np
+
+
+class StreamingAggregator:
+    """
+    کلاس برای تجمیع ماتریس‌های خبرگان یکی‌یکی، بدون ساخت پشته (experts, n, n)
+
+    سلول‌هایی که خبره پاسخ نداده (NaN یا mask=False) در میانگین آن سلول شمرده نمی‌شوند.
+    """
+
+    def __init__(self, shape):
+        """
+        مقداردهی اولیه
+
+        Parameters:
+        -----------
+        shape : tuple
+            شکل ماتریس هر خبره، مثلاً (n, n) یا (n, n, 3) برای اعداد مثلثی
+        """
+        self.shape = tuple(shape)
+        self.n_experts = 0
+        self.count = np.zeros(self.shape, dtype=np.int64)  # تعداد پاسخ هر سلول
+        self._mean = np.zeros(self.shape)
+        self._m2 = np.zeros(self.shape)  # مجموع مجذور انحراف‌ها (Welford)
+        self._log_sum = np.zeros(self.shape)  # مجموع لگاریتم مقادیر مثبت
+        self._zero_count = np.zeros(self.shape, dtype=np.int64)  # مقادیر صفر یا منفی برای میانگین هندسی
+
+    def update(self, matrix, mask=None):
+        """
+        افزودن ماتریس یک خبره
+        :param matrix: ماتریس خبره؛ NaN یعنی بدون پاسخ
+        :param mask: آرایه بولی اختیاری (True = پاسخ داده شده)
+        """
+        matrix = np.asarray(matrix, dtype=float)
+        if matrix.shape != self.shape:
+            raise ValueError(f"شکل ماتریس {matrix.shape} با {self.shape} یکسان نیست!")
+        answered = ~np.isnan(matrix)
+        if mask is not None:
+            answered &= np.asarray(mask, dtype=bool)
+        values = np.where(answered, matrix, 0.0)
+
+        self.n_experts += 1
+        self.count += answered
+        safe_count = np.maximum(self.count, 1)
+        delta = np.where(answered, values - self._mean, 0.0)
+        self._mean += delta / safe_count
+        self._m2 += delta * np.where(answered, values - self._mean, 0.0)
+
+        positive = answered & (values > 0)
+        self._log_sum += np.log(np.where(positive, values, 1.0))
+        self._zero_count += answered & ~positive
+
+    def update_batch(self, matrices):
+        """
+        افزودن یک دسته ماتریس (experts, ...) با ادغام موازی Welford (Chan)؛
+        مناسب برای برش‌های memmap از ExpertStore
+        """
+        matrices = np.asarray(matrices, dtype=float)
+        if matrices.shape[1:] != self.shape:
+            raise ValueError(f"شکل ماتریس {matrices.shape[1:]} با {self.shape} یکسان نیست!")
+        answered = ~np.isnan(matrices)
+        values = np.where(answered, matrices, 0.0)
+
+        batch_count = answered.sum(axis=0)
+        batch_mean = values.sum(axis=0) / np.maximum(batch_count, 1)
+        batch_m2 = (np.where(answered, values - batch_mean, 0.0) ** 2).sum(axis=0)
+
+        total = self.count + batch_count
+        safe_total = np.maximum(total, 1)
+        delta = batch_mean - self._mean
+        self._mean += delta * batch_count / safe_total
+        self._m2 += batch_m2 + delta ** 2 * self.count * batch_count / safe_total
+        self.count = total
+        self.n_experts += matrices.shape[0]
+
+        positive = answered & (values > 0)
+        self._log_sum += np.log(np.where(positive, values, 1.0)).sum(axis=0)
+        self._zero_count += (answered & ~positive).sum(axis=0)
+
+    def update_stream(self, matrices, masks=None):
+        """
+        مصرف ماتریس‌ها از یک generator یکی‌یکی
+        """
+        if masks is None:
+            for matrix in matrices:
+                self.update(matrix)
+        else:
+            for matrix, mask in zip(matrices, masks):
+                self.update(matrix, mask)
+        return self
+
+    def _answered(self, values):
+        return np.where(self.count > 0, values, np.nan)
+
+    @property
+    def mean(self):
+        """
+        میانگین حسابی هر سلول (NaN برای سلول بدون پاسخ)
+        """
+        return self._answered(self._mean)
+
+    @property
+    def variance(self):
+        """
+        واریانس نمونه‌ای هر سلول (NaN برای سلول‌های با کمتر از دو پاسخ)
+        """
+        return np.where(self.count > 1, self._m2 / np.maximum(self.count - 1, 1), np.nan)
+
+    @property
+    def geometric_mean(self):
+        """
+        میانگین هندسی هر سلول؛ اگر یکی از پاسخ‌ها صفر باشد نتیجه صفر است
+        """
+        geometric = np.exp(self._log_sum / np.maximum(self.count, 1))
+        return self._answered(np.where(self._zero_count > 0, 0.0, geometric))
+
+    def result(self, method='mean', fill_value=0.0):
+        """
+        ماتریس تجمیع‌شده برای ورود به normalize_matrix
+        :param method: 'mean' یا 'geometric'
+        :param fill_value: مقدار سلول‌هایی که هیچ خبره‌ای پاسخ نداده است
+        """
+        if method == 'mean':
+            combined = self.mean
+        elif method == 'geometric':
+            combined = self.geometric_mean
+        else:
+            raise ValueError(f"روش ناشناخته: {method}")
+        return np.where(np.isnan(combined), fill_value, combined)
+
+
+def aggregate_stream(matrices, method='mean', fill_value=0.0):
+    """
+    جایگزین جریانی combine_expert_opinions.
+    :param matrices: iterable یا generator از ماتریس‌های خبرگان (NaN = بدون پاسخ)
+    :param method: 'mean' یا 'geometric'
+    :param fill_value: مقدار سلول‌های بدون پاسخ
+    :return: (ماتریس تجمیع‌شده، شیء StreamingAggregator برای دسترسی به واریانس و تعداد پاسخ‌ها)
+    """
+    aggregator = None
+    for matrix in matrices:
+        if aggregator is None:
+            aggregator = StreamingAggregator(np.shape(matrix))
+        aggregator.update(matrix)
+    if aggregator is None:
+        raise ValueError("هیچ ماتریسی برای تجمیع وجود ندارد!")
+    return aggregator.result(method, fill_value), aggregator
+
+
+def expert_consistency(experts, consensus=None, chunk_size=256):
+    """
+    فاصله هر خبره از ماتریس اجماع (ریشه میانگین مجذور اختلاف روی سلول‌های پاسخ داده شده).
+    :param experts: آرایه یا memmap با شکل (experts, n, n[, 3]) که دسته به دسته خوانده می‌شود
+    :param consensus: ماتریس اجماع؛ اگر None باشد میانگین حسابی خبرگان استفاده می‌شود
+    :param chunk_size: تعداد خبره در هر دسته
+    :return: آرایه با طول تعداد خبرگان
+    """
+    if consensus is None:
+        aggregator = StreamingAggregator(experts.shape[1:])
+        for start in range(0, len(experts), chunk_size):
+            aggregator.update_batch(experts[start:start + chunk_size])
+        consensus = aggregator.mean
+
+    deviations = []
+    axes = tuple(range(1, experts.ndim))
+    for start in range(0, len(experts), chunk_size):
+        squared = (np.asarray(experts[start:start + chunk_size]) - consensus) ** 2
+        deviations.append(np.sqrt(np.nanmean(squared, axis=axes)))
+    return np.concatenate(deviations)
+
+
+if __name__ == "__main__":
+    from .excel_io import read_expert_opinions
+
+    file_paths = ['expert1.xlsx', 'expert2.xlsx', 'expert3.xlsx', 'expert4.xlsx', 'expert5.xlsx']
+    combined, stats = aggregate_stream(read_expert_opinions(file_paths, missing=np.nan))
+
+    print("Combined Expert Opinions Matrix:\n", combined)
+    print("بیشترین واریانس بین خبرگان:", np.nanmax(stats.variance))
+    print("میانگین هندسی (سه سطر اول):\n", stats.result('geometric')[:3])
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+آزمون کرانه‌های DEMATEL Fuzzy: مقدار دقیق باید بین کرانه Lower و Upper بماند
+"""
+
+import numpy as np
+
+from dematel_lib.fuzzy import fuzzy_dematel
+
+
+def _random_judgments(rng, experts=3, n=8):
+    """
+    اعداد مثلثی معتبر (L ≤ M ≤ U) روی مقیاس 0 تا 4 با قطر صفر
+    """
+    judgments = np.sort(rng.integers(0, 5, size=(experts, n, n, 3)), axis=-1).astype(float)
+    judgments[:, np.arange(n), np.arange(n)] = 0
+    return judgments
+
+
+def test_crisp_degrees_within_fuzzy_bounds():
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        results = fuzzy_dematel(_random_judgments(rng))
+        assert np.all(results['T_Lower'] <= results['T'] + 1e-12)
+        assert np.all(results['T'] <= results['T_Upper'] + 1e-12)
+        for key in ('R', 'C', 'D'):
+            assert np.all(results[f'{key}_Lower'] <= results[key] + 1e-12)
+            assert np.all(results[key] <= results[f'{key}_Upper'] + 1e-12)